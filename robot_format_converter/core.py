@@ -18,6 +18,7 @@ Core format conversion engine and orchestration classes.
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import Dict, Any, Optional, Union, Type, List
 from abc import ABC, abstractmethod
@@ -31,6 +32,43 @@ logger = logging.getLogger(__name__)
 class BaseParser(ABC):
     """Abstract base class for format parsers."""
     
+    # Number of documents loaded by can_parse() kept for a following parse()
+    _PARSE_CACHE_SIZE = 8
+    
+    # Per-instance document cache, created on first use so subclasses that
+    # do not call super().__init__() still work
+    _parse_cache: Optional[Dict[tuple, Any]] = None
+    
+    @staticmethod
+    def _cache_key(file_path: Union[str, Path]) -> Optional[tuple]:
+        """Key a file by path, modification time and size, None if it cannot be stat'ed."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return (str(file_path), st.st_mtime_ns, st.st_size)
+    
+    def _cache_document(self, file_path: Union[str, Path], document: Any) -> None:
+        """Remember a document loaded by can_parse() for the next parse()."""
+        key = self._cache_key(file_path)
+        if key is None:
+            return
+        cache = self._parse_cache
+        if cache is None:
+            cache = self._parse_cache = {}
+        elif len(cache) >= self._PARSE_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[key] = document
+    
+    def _take_cached_document(self, file_path: Union[str, Path]) -> Optional[Any]:
+        """Pop the document cached for an unmodified file, if any."""
+        if not self._parse_cache:
+            return None
+        key = self._cache_key(file_path)
+        if key is None:
+            return None
+        return self._parse_cache.pop(key, None)
+    
     @abstractmethod
     def parse(self, input_path: Union[str, Path]) -> CommonSchema:
         """Parse input file and return common schema representation."""
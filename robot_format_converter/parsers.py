@@ -17,13 +17,22 @@
 Format parsers for converting robot description formats to common schema.
 """
 
-import xml.etree.ElementTree as ET
+import os
 import math
+import functools
 import logging
 import json
 from pathlib import Path
 from typing import Union, Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import numpy as np
+
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
 
 try:
     import yaml
@@ -36,13 +45,42 @@ from .schema import (
     CommonSchema, Metadata, Link, Joint, Actuator, Sensor, Contact,
     JointType, GeometryType, ActuatorType, Vector3, Quaternion, Pose,
     Inertia, Geometry, Visual, Collision, Material, JointLimits, JointDynamics,
-    ContactSurface
+    ContactSurface, _ZERO_V3, _UNIT_Z, _UNIT_Q, _JOINT_TYPE_BY_VALUE
 )
 from .utils import sanitize_name
 
 logger = logging.getLogger(__name__)
 
 
+def _xml_parser():
+    """Create the XML parser for one document, or None for the stdlib default.
+    
+    lxml drops whitespace-only text nodes while parsing and never resolves
+    external entities. Parsers are created per call because an lxml parser
+    must not be shared between threads.
+    """
+    if LXML_AVAILABLE:
+        return ET.XMLParser(remove_blank_text=True, resolve_entities=False)
+    return None
+
+
+def _parse_xml(source: Union[str, Path]):
+    """Parse an XML file, using lxml when it is installed.
+    
+    The file is opened here so both backends raise the same OSError
+    subclasses (e.g. FileNotFoundError) for unreadable paths.
+    """
+    with open(source, 'rb') as f:
+        if LXML_AVAILABLE:
+            return ET.parse(f, _xml_parser(), base_url=str(source))
+        return ET.parse(f)
+
+
+def _xml_fromstring(data: bytes):
+    """Parse an in-memory XML document into its root element."""
+    return ET.fromstring(data, _xml_parser())
+
+
 class ParseError(Exception):
     """Exception raised during parsing errors."""
     pass
@@ -62,6 +100,8 @@ class ParseContext:
     meshes: Dict[str, str]
     warnings: List[str]
     errors: List[str]
+    # Joint axes collected during traversal and normalized in one batch
+    pending_axes: List[Tuple[Joint, List[float]]] = field(default_factory=list)
     
     def add_warning(self, message: str, element: Optional[str] = None):
         """Add warning message with optional element context."""
@@ -78,6 +118,36 @@ class ParseContext:
         logger.error(message)
 
 
+# URDF joint types supported by the common schema
+_URDF_JOINT_TYPES = {
+    'revolute': JointType.REVOLUTE,
+    'continuous': JointType.CONTINUOUS,
+    'prismatic': JointType.PRISMATIC,
+    'fixed': JointType.FIXED,
+    'floating': JointType.FLOATING,
+    'planar': JointType.PLANAR
+}
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_triple(text: str) -> Optional[Tuple[float, float, float]]:
+    """Parse a whitespace-separated triple of floats, or None if invalid.
+    
+    Memoized because robot files repeat the same few strings ("0 0 0",
+    "0 0 1") for every origin and axis; results are immutable tuples.
+    """
+    if not text:
+        return None
+    
+    try:
+        values = tuple(float(x) for x in text.split())
+    except ValueError:
+        return None
+    if len(values) != 3:
+        return None
+    return values
+
+
 class URDFParser(BaseParser):
     """ URDF parser with enhanced validation and error handling."""
     
@@ -88,7 +158,7 @@ class URDFParser(BaseParser):
     def can_parse(self, file_path: Union[str, Path]) -> bool:
         """Check if file is a valid URDF file with enhanced validation."""
         try:
-            tree = ET.parse(file_path)
+            tree = _parse_xml(file_path)
             root = tree.getroot()
             
             # Basic tag validation
@@ -105,8 +175,9 @@ class URDFParser(BaseParser):
                 logger.warning(f"URDF file {file_path} has no links")
                 return False
             
+            self._cache_document(file_path, tree)
             return True
-            
+        
         except ET.ParseError as e:
             logger.error(f"XML parsing error in {file_path}: {e}")
             return False
@@ -118,12 +189,41 @@ class URDFParser(BaseParser):
         """Parse URDF file with comprehensive validation and error handling."""
         file_path = Path(input_path)
         
+        # Reuse the tree loaded by can_parse() if the file is unchanged
+        tree = self._take_cached_document(file_path)
+        if tree is None:
+            try:
+                tree = _parse_xml(file_path)
+            except ET.ParseError as e:
+                raise ParseError(f"XML parsing error: {e}")
+        
+        return self._parse_root(tree.getroot(), file_path)
+    
+    def parse_bytes(self, data: bytes,
+                    file_path: Union[str, Path] = 'robot.urdf') -> CommonSchema:
+        """
+        Parse an in-memory URDF document instead of reading it from disk.
+        
+        Relative mesh paths are still resolved against ``file_path`` and
+        checked for existence, so missing meshes are reported as usual.
+        
+        Args:
+            data: Encoded URDF document
+            file_path: Nominal location of the document, used in messages
+                and to resolve relative mesh paths
+        
+        Returns:
+            Parsed robot schema
+        """
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
+            root = _xml_fromstring(data)
         except ET.ParseError as e:
             raise ParseError(f"XML parsing error: {e}")
         
+        return self._parse_root(root, Path(file_path))
+    
+    def _parse_root(self, root: ET.Element, file_path: Path) -> CommonSchema:
+        """Build the schema from a parsed URDF root element."""
         # Initialize parse context for enhanced error tracking
         context = ParseContext(
             file_path=file_path,
@@ -277,23 +377,21 @@ class URDFParser(BaseParser):
                     context.add_warning("Inertia tensor may be invalid", link.name)
                 
                 link.inertia = inertia
-                
+            
             except ValueError as e:
                 context.add_error(f"Invalid inertia values: {e}", link.name)
     
     def _validate_inertia(self, inertia: Inertia) -> bool:
-        """Enhanced validation of inertia tensor for physical plausibility."""
-        # Check diagonal elements are positive
-        if inertia.ixx <= 0 or inertia.iyy <= 0 or inertia.izz <= 0:
-            return False
-        
-        # Check triangle inequality for physical validity
-        if (inertia.ixx + inertia.iyy <= inertia.izz or
-            inertia.iyy + inertia.izz <= inertia.ixx or
-            inertia.ixx + inertia.izz <= inertia.iyy):
-            return False
-        
-        return True
+        """Enhanced validation of inertia tensor for physical plausibility.
+        
+        Diagonal moments must be positive and satisfy the triangle
+        inequality; equality is allowed since flat bodies reach it.
+        """
+        ixx, iyy, izz = inertia.ixx, inertia.iyy, inertia.izz
+        return (ixx > 0 and iyy > 0 and izz > 0 and
+                ixx + iyy >= izz and
+                iyy + izz >= ixx and
+                ixx + izz >= iyy)
     
     def _parse_joint(self, elem: ET.Element, context: ParseContext, 
                     link_names: set) -> Optional[Joint]:
@@ -310,16 +408,7 @@ class URDFParser(BaseParser):
             return None
         
         # Map URDF joint types to common schema
-        type_mapping = {
-            'revolute': JointType.REVOLUTE,
-            'continuous': JointType.CONTINUOUS,
-            'prismatic': JointType.PRISMATIC,
-            'fixed': JointType.FIXED,
-            'floating': JointType.FLOATING,
-            'planar': JointType.PLANAR
-        }
-        
-        joint_type_enum = type_mapping.get(joint_type)
+        joint_type_enum = _URDF_JOINT_TYPES.get(joint_type)
         if not joint_type_enum:
             context.add_error(f"Unsupported joint type: {joint_type}", name)
             return None
@@ -360,7 +449,10 @@ class URDFParser(BaseParser):
         axis = elem.find('axis')
         if axis is not None:
             axis_xyz = self._parse_xyz(axis.get('xyz', '0 0 1'))
-            if axis_xyz:
+            if axis_xyz == (0.0, 0.0, 1.0):
+                # Default axis: share the immutable constant
+                joint.axis = _UNIT_Z
+            elif axis_xyz:
                 # Normalize axis vector
                 axis_vec = Vector3(axis_xyz[0], axis_xyz[1], axis_xyz[2])
                 magnitude = math.sqrt(axis_vec.x**2 + axis_vec.y**2 + axis_vec.z**2)
@@ -596,7 +688,7 @@ class URDFParser(BaseParser):
             filename = mesh_elem.get('filename')
             if filename:
                 # Resolve relative paths
-                if not Path(filename).is_absolute():
+                if not os.path.isabs(filename):
                     full_path = context.base_dir / filename
                     if full_path.exists():
                         filename = str(full_path)
@@ -622,31 +714,13 @@ class URDFParser(BaseParser):
         context.add_warning("No valid geometry found")
         return None
     
-    def _parse_xyz(self, xyz_str: str) -> Optional[List[float]]:
+    def _parse_xyz(self, xyz_str: str) -> Optional[Tuple[float, float, float]]:
         """Parse XYZ coordinate string with validation."""
-        if not xyz_str:
-            return None
-        
-        try:
-            values = [float(x.strip()) for x in xyz_str.split()]
-            if len(values) != 3:
-                return None
-            return values
-        except ValueError:
-            return None
+        return _parse_triple(xyz_str)
     
-    def _parse_rpy(self, rpy_str: str) -> Optional[List[float]]:
+    def _parse_rpy(self, rpy_str: str) -> Optional[Tuple[float, float, float]]:
         """Parse RPY angle string with validation."""
-        if not rpy_str:
-            return None
-        
-        try:
-            values = [float(x.strip()) for x in rpy_str.split()]
-            if len(values) != 3:
-                return None
-            return values
-        except ValueError:
-            return None
+        return _parse_triple(rpy_str)
     
     def _parse_float(self, value: Optional[str]) -> Optional[float]:
         """Parse float value with error handling."""
@@ -658,6 +732,124 @@ class URDFParser(BaseParser):
             return None
 
 
+# Below this many axes NumPy beats numba's thread dispatch overhead
+_NUMBA_MIN_AXES = 4096
+
+# Compiled numba kernel for _normalize_axes, built on first use; False
+# when numba is not installed
+_normalize_axes_nb = None
+
+
+def _numba_normalize_axes():
+    """Return the numba axis-normalization kernel, or None without numba.
+    
+    numba is imported here rather than at module level since importing it
+    is slow and only very large batches use the kernel.
+    """
+    global _normalize_axes_nb
+    if _normalize_axes_nb is None:
+        try:
+            from numba import njit, prange
+        except ImportError:
+            _normalize_axes_nb = False
+            return None
+        
+        @njit(parallel=True, fastmath=True)
+        def kernel(axes, tol):
+            norms = np.empty(axes.shape[0])
+            for i in prange(axes.shape[0]):
+                norm = np.sqrt(axes[i, 0] ** 2 + axes[i, 1] ** 2 + axes[i, 2] ** 2)
+                norms[i] = norm
+                if norm > tol:
+                    axes[i, 0] /= norm
+                    axes[i, 1] /= norm
+                    axes[i, 2] /= norm
+            return norms
+        
+        _normalize_axes_nb = kernel
+    return _normalize_axes_nb or None
+
+
+def _normalize_axes(axes: np.ndarray, tol: float = 1e-6) -> np.ndarray:
+    """
+    Normalize an (N, 3) array of joint axes in place.
+    
+    Rows with magnitude <= ``tol`` are left untouched.
+    
+    Returns:
+        Array of the original row magnitudes
+    """
+    if len(axes) >= _NUMBA_MIN_AXES:
+        kernel = _numba_normalize_axes()
+        if kernel is not None:
+            return kernel(axes, tol)
+    norms = np.sqrt((axes * axes).sum(axis=1))
+    valid = norms > tol
+    axes[valid] /= norms[valid, None]
+    return norms
+
+
+def _parse_floats(value: str, count: int) -> List[float]:
+    """Parse exactly ``count`` whitespace-separated floats, else ValueError."""
+    values = [float(x) for x in value.split()]
+    if len(values) != count:
+        raise ValueError(f"expected {count} values, got {len(values)}")
+    return values
+
+
+def _set_mass(link: Link, values: List[float], context: ParseContext):
+    link.mass = values[0]
+    if link.mass < 0:
+        context.add_warning(f"Negative mass for link {link.name}")
+
+
+def _set_com(link: Link, values: List[float], context: ParseContext):
+    link.center_of_mass = Vector3(values[0], values[1], values[2])
+
+
+def _set_diaginertia(link: Link, values: List[float], context: ParseContext):
+    # Convert MuJoCo diagonal inertia to full tensor
+    link.inertia = Inertia(
+        ixx=values[0], iyy=values[1], izz=values[2],
+        ixy=0.0, ixz=0.0, iyz=0.0
+    )
+
+
+def _set_fullinertia(link: Link, values: List[float], context: ParseContext):
+    # MuJoCo fullinertia format: Ixx Iyy Izz Ixy Ixz Iyz
+    link.inertia = Inertia(
+        ixx=values[0], iyy=values[1], izz=values[2],
+        ixy=values[3], ixz=values[4], iyz=values[5]
+    )
+
+
+# MJCF <inertial> attributes: (attribute, value count, setter,
+# context reporter on failure, description used in the message).
+# Order matters: fullinertia overrides diaginertia when both are given.
+_INERTIAL_FIELDS = (
+    ('mass', 1, _set_mass, 'add_error', 'mass value'),
+    ('pos', 3, _set_com, 'add_warning', 'center of mass'),
+    ('diaginertia', 3, _set_diaginertia, 'add_error', 'inertia values'),
+    ('fullinertia', 6, _set_fullinertia, 'add_error', 'full inertia values'),
+)
+
+
+# MJCF joint types mapped to the common schema (unknown types -> REVOLUTE)
+_MJCF_JOINT_TYPES = {
+    'hinge': JointType.REVOLUTE,
+    'slide': JointType.PRISMATIC,
+    'ball': JointType.SPHERICAL,
+    'free': JointType.FLOATING
+}
+
+
+# MJCF sensor elements converted to Sensor entries
+_SENSOR_TYPES = frozenset((
+    'accelerometer', 'gyro', 'force', 'torque',
+    'magnetometer', 'rangefinder', 'camera'
+))
+
+
 class MJCFParser(BaseParser):
     """ MJCF parser with comprehensive MuJoCo support and enhanced validation."""
     
@@ -668,9 +860,12 @@ class MJCFParser(BaseParser):
     def can_parse(self, file_path: Union[str, Path]) -> bool:
         """Check if file is a valid MJCF file."""
         try:
-            tree = ET.parse(file_path)
+            tree = _parse_xml(file_path)
             root = tree.getroot()
-            return root.tag == 'mujoco'
+            if root.tag != 'mujoco':
+                return False
+            self._cache_document(file_path, tree)
+            return True
         except Exception:
             return False
     
@@ -678,12 +873,41 @@ class MJCFParser(BaseParser):
         """Parse MJCF file with enhanced validation and comprehensive support."""
         file_path = Path(input_path)
         
+        # Reuse the tree loaded by can_parse() if the file is unchanged
+        tree = self._take_cached_document(file_path)
+        if tree is None:
+            try:
+                tree = _parse_xml(file_path)
+            except ET.ParseError as e:
+                raise ParseError(f"XML parsing error: {e}")
+        
+        return self._parse_root(tree.getroot(), file_path)
+    
+    def parse_bytes(self, data: bytes,
+                    file_path: Union[str, Path] = 'robot.xml') -> CommonSchema:
+        """
+        Parse an in-memory MJCF document instead of reading it from disk.
+        
+        Relative mesh paths are still resolved against ``file_path`` and
+        checked for existence, so missing meshes are reported as usual.
+        
+        Args:
+            data: Encoded MJCF document
+            file_path: Nominal location of the document, used in messages
+                and to resolve relative mesh paths
+        
+        Returns:
+            Parsed robot schema
+        """
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
+            root = _xml_fromstring(data)
         except ET.ParseError as e:
             raise ParseError(f"XML parsing error: {e}")
         
+        return self._parse_root(root, Path(file_path))
+    
+    def _parse_root(self, root: ET.Element, file_path: Path) -> CommonSchema:
+        """Build the schema from a parsed MJCF root element."""
         # Initialize parse context
         context = ParseContext(
             file_path=file_path,
@@ -733,6 +957,8 @@ class MJCFParser(BaseParser):
             except Exception as e:
                 context.add_error(f"Failed to parse body hierarchy: {e}")
         
+        self._apply_joint_axes(context)
+        
         # Parse actuators
         actuators = []
         actuator_elem = root.find('actuator')
@@ -853,61 +1079,14 @@ class MJCFParser(BaseParser):
     def _parse_mjcf_inertial(self, inertial_elem: ET.Element, link: Link, 
                             context: ParseContext):
         """Parse MJCF inertial properties with validation."""
-        # Parse mass
-        mass_str = inertial_elem.get('mass')
-        if mass_str:
-            try:
-                link.mass = float(mass_str)
-                if link.mass < 0:
-                    context.add_warning(f"Negative mass for link {link.name}")
-            except ValueError:
-                context.add_error(f"Invalid mass value for link {link.name}")
-        
-        # Parse center of mass position
-        pos_str = inertial_elem.get('pos')
-        if pos_str:
-            try:
-                pos_values = [float(x) for x in pos_str.split()]
-                if len(pos_values) == 3:
-                    link.center_of_mass = Vector3(
-                        pos_values[0], pos_values[1], pos_values[2]
-                    )
-            except ValueError:
-                context.add_warning(f"Invalid center of mass for link {link.name}")
-        
-        # Parse inertia matrix (diagonal elements)
-        diaginertia_str = inertial_elem.get('diaginertia')
-        if diaginertia_str:
+        for attr, count, setter, report, what in _INERTIAL_FIELDS:
+            value = inertial_elem.get(attr)
+            if not value:
+                continue
             try:
-                diag_values = [float(x) for x in diaginertia_str.split()]
-                if len(diag_values) == 3:
-                    # Convert MuJoCo diagonal inertia to full tensor
-                    link.inertia = Inertia(
-                        ixx=diag_values[0],
-                        iyy=diag_values[1],
-                        izz=diag_values[2],
-                        ixy=0.0, ixz=0.0, iyz=0.0
-                    )
+                setter(link, _parse_floats(value, count), context)
             except ValueError:
-                context.add_error(f"Invalid inertia values for link {link.name}")
-        
-        # Parse full inertia matrix if available
-        fullinertia_str = inertial_elem.get('fullinertia')
-        if fullinertia_str:
-            try:
-                inertia_values = [float(x) for x in fullinertia_str.split()]
-                if len(inertia_values) == 6:
-                    # MuJoCo fullinertia format: Ixx Iyy Izz Ixy Ixz Iyz
-                    link.inertia = Inertia(
-                        ixx=inertia_values[0],
-                        iyy=inertia_values[1],
-                        izz=inertia_values[2],
-                        ixy=inertia_values[3],
-                        ixz=inertia_values[4],
-                        iyz=inertia_values[5]
-                    )
-            except ValueError:
-                context.add_error(f"Invalid full inertia values for link {link.name}")
+                getattr(context, report)(f"Invalid {what} for link {link.name}")
     
     def _parse_mjcf_geometry(self, geom_elem: ET.Element, link: Link, 
                             context: ParseContext):
@@ -982,7 +1161,7 @@ class MJCFParser(BaseParser):
                     if len(pos_values) == 3:
                         position = Vector3(pos_values[0], pos_values[1], pos_values[2])
                         
-                        orientation = Quaternion(0, 0, 0, 1)  # Default
+                        orientation = _UNIT_Q  # Default
                         if quat_str:
                             quat_values = [float(x) for x in quat_str.split()]
                             if len(quat_values) == 4:
@@ -993,29 +1172,29 @@ class MJCFParser(BaseParser):
                                 )
                         
                         pose = Pose(position=position, orientation=orientation)
-                        
+                
                 except ValueError:
                     context.add_warning(f"Invalid geometry position for link {link.name}")
             
-            # Determine if visual or collision based on group
+            # Determine if visual or collision based on group: groups 0-1 are
+            # the MJCF defaults and serve both roles, group 2 is visual-only
+            # and groups 3+ are collision-only (as written by MJCFExporter)
             group = geom_elem.get('group', '0')
             group_int = int(group) if group.isdigit() else 0
             
-            # Create both visual and collision by default, following MJCF convention
-            visual = Visual(
-                name=f'{link.name}_visual_{len(link.visuals)}',
-                geometry=geometry, 
-                material=material, 
-                pose=pose
-            )
-            collision = Collision(
-                name=f'{link.name}_collision_{len(link.collisions)}',
-                geometry=geometry, 
-                pose=pose
-            )
-            
-            link.visuals.append(visual)
-            link.collisions.append(collision)
+            if group_int < 3:
+                link.visuals.append(Visual(
+                    name=f'{link.name}_visual_{len(link.visuals)}',
+                    geometry=geometry, 
+                    material=material, 
+                    pose=pose
+                ))
+            if group_int != 2:
+                link.collisions.append(Collision(
+                    name=f'{link.name}_collision_{len(link.collisions)}',
+                    geometry=geometry, 
+                    pose=pose
+                ))
     
     def _parse_mjcf_joint(self, joint_elem: ET.Element, parent_link: str, 
                          child_link: str, context: ParseContext) -> Optional[Joint]:
@@ -1028,14 +1207,7 @@ class MJCFParser(BaseParser):
         
         # Parse joint type
         joint_type_str = joint_elem.get('type', 'hinge')
-        type_mapping = {
-            'hinge': JointType.REVOLUTE,
-            'slide': JointType.PRISMATIC,
-            'ball': JointType.SPHERICAL,
-            'free': JointType.FLOATING
-        }
-        
-        joint_type = type_mapping.get(joint_type_str, JointType.REVOLUTE)
+        joint_type = _MJCF_JOINT_TYPES.get(joint_type_str, JointType.REVOLUTE)
         
         joint = Joint(
             name=joint_name,
@@ -1044,22 +1216,13 @@ class MJCFParser(BaseParser):
             child_link=child_link
         )
         
-        # Parse joint axis with normalization
+        # Parse joint axis; normalization is deferred to _apply_joint_axes
         axis_str = joint_elem.get('axis')
         if axis_str:
             try:
                 axis_values = [float(x) for x in axis_str.split()]
                 if len(axis_values) == 3:
-                    # Normalize axis
-                    magnitude = math.sqrt(sum(x**2 for x in axis_values))
-                    if magnitude > 1e-6:
-                        joint.axis = Vector3(
-                            axis_values[0] / magnitude,
-                            axis_values[1] / magnitude,
-                            axis_values[2] / magnitude
-                        )
-                    else:
-                        context.add_warning(f"Zero-magnitude joint axis for {joint_name}")
+                    context.pending_axes.append((joint, axis_values))
             except ValueError:
                 context.add_warning(f"Invalid joint axis for {joint_name}")
         
@@ -1090,6 +1253,23 @@ class MJCFParser(BaseParser):
         
         return joint
     
+    def _apply_joint_axes(self, context: ParseContext):
+        """Normalize all collected joint axes in one pass and assign them."""
+        if not context.pending_axes:
+            return
+        
+        axes = np.array([values for _, values in context.pending_axes],
+                        dtype=np.float64)
+        norms = _normalize_axes(axes)
+        
+        for (joint, _), axis, norm in zip(context.pending_axes, axes.tolist(),
+                                          norms.tolist()):
+            if norm > 1e-6:
+                joint.axis = Vector3(axis[0], axis[1], axis[2])
+            else:
+                context.add_warning(f"Zero-magnitude joint axis for {joint.name}")
+        context.pending_axes.clear()
+    
     def _parse_materials(self, asset_elem: ET.Element, 
                         context: ParseContext) -> Dict[str, Material]:
         """Parse materials from asset section with validation."""
@@ -1144,7 +1324,7 @@ class MJCFParser(BaseParser):
             
             if name and filename:
                 # Resolve relative paths
-                if not Path(filename).is_absolute():
+                if not os.path.isabs(filename):
                     full_path = context.base_dir / filename
                     if full_path.exists():
                         meshes[name] = str(full_path)
@@ -1204,38 +1384,36 @@ class MJCFParser(BaseParser):
         """Parse sensor definitions with comprehensive type support."""
         sensors = []
         
-        # Parse various sensor types
-        sensor_types = [
-            'accelerometer', 'gyro', 'force', 'torque', 
-            'magnetometer', 'rangefinder', 'camera'
-        ]
-        
-        for sensor_type in sensor_types:
-            for sens_elem in sensor_elem.findall(sensor_type):
-                name = sens_elem.get('name')
-                site = sens_elem.get('site')
-                
-                if not name:
-                    context.add_warning(f"Sensor {sensor_type} missing name")
-                    continue
-                
-                sensor = Sensor(
-                    name=sanitize_name(name),
-                    type=sensor_type,
-                    parent_link=site or 'world'
-                )
-                
-                # Parse sensor-specific parameters
-                if sensor_type == 'camera':
-                    resolution = sens_elem.get('resolution')
-                    if resolution:
-                        try:
-                            res_values = [int(x) for x in resolution.split()]
-                            sensor.parameters['resolution'] = res_values
-                        except ValueError:
-                            context.add_warning(f"Invalid resolution for camera {name}")
-                
-                sensors.append(sensor)
+        # Single pass over the children, keeping supported sensor types
+        for sens_elem in sensor_elem:
+            sensor_type = sens_elem.tag
+            if sensor_type not in _SENSOR_TYPES:
+                continue
+            
+            name = sens_elem.get('name')
+            site = sens_elem.get('site')
+            
+            if not name:
+                context.add_warning(f"Sensor {sensor_type} missing name")
+                continue
+            
+            sensor = Sensor(
+                name=sanitize_name(name),
+                type=sensor_type,
+                parent_link=site or 'world'
+            )
+            
+            # Parse sensor-specific parameters
+            if sensor_type == 'camera':
+                resolution = sens_elem.get('resolution')
+                if resolution:
+                    try:
+                        res_values = [int(x) for x in resolution.split()]
+                        sensor.parameters['resolution'] = res_values
+                    except ValueError:
+                        context.add_warning(f"Invalid resolution for camera {name}")
+            
+            sensors.append(sensor)
         
         return sensors
     
@@ -1261,12 +1439,14 @@ class SchemaParser(BaseParser):
                 if not YAML_AVAILABLE:
                     return False
                 with open(path, 'r') as f:
-                    yaml.safe_load(f)
-                return True
+                    data = yaml.safe_load(f)
             elif path.suffix.lower() == '.json':
                 with open(path, 'r') as f:
-                    json.load(f)
-                return True
+                    data = json.load(f)
+            else:
+                return False
+            self._cache_document(path, data)
+            return True
         except Exception:
             pass
         return False
@@ -1275,13 +1455,16 @@ class SchemaParser(BaseParser):
         """Parse schema file to common schema."""
         path = Path(input_path)
         
-        # Load data based on file extension
-        if path.suffix.lower() in ['.yaml', '.yml']:
-            with open(path, 'r') as f:
-                data = yaml.safe_load(f)
-        else:  # JSON
-            with open(path, 'r') as f:
-                data = json.load(f)
+        # Reuse the data loaded by can_parse() if the file is unchanged
+        data = self._take_cached_document(path)
+        if data is None:
+            # Load data based on file extension
+            if path.suffix.lower() in ['.yaml', '.yml']:
+                with open(path, 'r') as f:
+                    data = yaml.safe_load(f)
+            else:  # JSON
+                with open(path, 'r') as f:
+                    data = json.load(f)
         
         # Convert dictionary to CommonSchema
         return self._dict_to_schema(data)
@@ -1328,18 +1511,9 @@ class SchemaParser(BaseParser):
             joint_type = joint_data.get('type', 'fixed')
             
             # Map string to enum
-            type_mapping = {
-                'revolute': JointType.REVOLUTE,
-                'continuous': JointType.CONTINUOUS,
-                'prismatic': JointType.PRISMATIC,
-                'fixed': JointType.FIXED,
-                'floating': JointType.FLOATING,
-                'planar': JointType.PLANAR
-            }
-            
             joint = Joint(
                 name=joint_data['name'],
-                type=type_mapping.get(joint_type, JointType.FIXED),
+                type=_JOINT_TYPE_BY_VALUE.get(joint_type, JointType.FIXED),
                 parent_link=joint_data['parent_link'],
                 child_link=joint_data['child_link']
             )
@@ -1347,17 +1521,26 @@ class SchemaParser(BaseParser):
             # Parse pose
             pose_data = joint_data.get('pose', {})
             if pose_data:
-                pos_data = pose_data.get('position', [0, 0, 0])
-                orient_data = pose_data.get('orientation', [0, 0, 0, 1])
+                pos_data = pose_data.get('position')
+                orient_data = pose_data.get('orientation')
                 joint.pose = Pose(
-                    position=Vector3(pos_data[0], pos_data[1], pos_data[2]),
-                    orientation=Quaternion(orient_data[0], orient_data[1], 
-                                         orient_data[2], orient_data[3])
+                    position=(
+                        Vector3(pos_data[0], pos_data[1], pos_data[2])
+                        if pos_data else _ZERO_V3
+                    ),
+                    orientation=(
+                        Quaternion(orient_data[0], orient_data[1], 
+                                   orient_data[2], orient_data[3])
+                        if orient_data else _UNIT_Q
+                    )
                 )
             
             # Parse axis
-            axis_data = joint_data.get('axis', [0, 0, 1])
-            joint.axis = Vector3(axis_data[0], axis_data[1], axis_data[2])
+            axis_data = joint_data.get('axis')
+            joint.axis = (
+                Vector3(axis_data[0], axis_data[1], axis_data[2])
+                if axis_data and axis_data != [0, 0, 1] else _UNIT_Z
+            )
             
             # Parse limits
             limits_data = joint_data.get('limits', {})
@@ -1408,18 +1591,21 @@ class SDFParser(BaseParser):
     def can_parse(self, file_path: Union[str, Path]) -> bool:
         """Check if file is a valid SDF file."""
         try:
-            import xml.etree.ElementTree as ET
-            tree = ET.parse(file_path)
+            tree = _parse_xml(file_path)
             root = tree.getroot()
-            return root.tag in ['sdf', 'world']
+            if root.tag not in ['sdf', 'world']:
+                return False
+            self._cache_document(file_path, tree)
+            return True
         except Exception:
             return False
     
     def parse(self, input_path: Union[str, Path]) -> CommonSchema:
         """Parse SDF file to common schema."""
         # Simplified SDF parser - full implementation would be much more complex
-        import xml.etree.ElementTree as ET
-        tree = ET.parse(input_path)
+        tree = self._take_cached_document(input_path)
+        if tree is None:
+            tree = _parse_xml(input_path)
         root = tree.getroot()
         
         metadata = Metadata(
@@ -1458,7 +1644,7 @@ class USDParser(BaseParser):
             )
             
             return CommonSchema(metadata=metadata)
-            
+        
         except ImportError:
             raise RuntimeError("USD support requires pxr module: pip install usd-core")
 
@@ -1466,13 +1652,10 @@ class USDParser(BaseParser):
 # Export all parsers
 __all__ = [
     'URDFParser',
-    'MJCFParser', 
+    'MJCFParser',
     'SchemaParser',
     'SDFParser',
     'USDParser',
-    'URDFParser',
-    'MJCFParser',
-    'SchemaParser',
     'ParseError',
     'ValidationError',
     'ParseContext'
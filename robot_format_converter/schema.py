@@ -21,12 +21,19 @@ the semantics of different robot description formats while preserving
 format-specific information through extensions.
 """
 
-from typing import Dict, List, Optional, Union, Any
+import sys
+import math
+from collections import Counter, deque
+from typing import Dict, List, Optional, Tuple, Union, Any
 from dataclasses import dataclass, field
 from enum import Enum
 import numpy as np
 
 
+# dataclass(slots=True) requires Python 3.10+; older versions keep __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
 class JointType(Enum):
     """Supported joint types across formats."""
     REVOLUTE = "revolute"
@@ -60,7 +67,15 @@ class ActuatorType(Enum):
     MUSCLE = "muscle"  # MJCF specific
 
 
-@dataclass
+# value -> member maps for parsing type strings with a single dict lookup.
+# Enum keeps these itself (_value2member_map_); unlike calling the Enum,
+# .get() returns None for unknown values instead of raising ValueError.
+_JOINT_TYPE_BY_VALUE: Dict[str, JointType] = JointType._value2member_map_
+_GEOMETRY_TYPE_BY_VALUE: Dict[str, GeometryType] = GeometryType._value2member_map_
+_ACTUATOR_TYPE_BY_VALUE: Dict[str, ActuatorType] = ActuatorType._value2member_map_
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Vector3:
     """3D vector representation."""
     x: float = 0.0
@@ -81,7 +96,7 @@ class Vector3:
         return cls(values[0], values[1], values[2])
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Quaternion:
     """Quaternion representation for rotations."""
     x: float = 0.0
@@ -93,19 +108,55 @@ class Quaternion:
         """Convert to list format [x, y, z, w]."""
         return [self.x, self.y, self.z, self.w]
     
+    @staticmethod
+    def _from_half_angles(cr, cp, cy, sr, sp, sy):
+        """Compose R = Rz(yaw) Ry(pitch) Rx(roll) from half-angle cos/sin.
+        
+        Works on floats and on NumPy arrays alike, so the scalar and batch
+        conversions share one formula.
+        """
+        return (sr * cp * cy - cr * sp * sy,
+                cr * sp * cy + sr * cp * sy,
+                cr * cp * sy - sr * sp * cy,
+                cr * cp * cy + sr * sp * sy)
+    
     @classmethod
     def from_rpy(cls, roll: float, pitch: float, yaw: float) -> 'Quaternion':
-        """Create quaternion from roll-pitch-yaw angles."""
-        # Simplified conversion - full implementation would use proper math
-        # This is a placeholder for demonstration
-        return cls(0.0, 0.0, 0.0, 1.0)
+        """Create quaternion from roll-pitch-yaw angles (URDF convention)."""
+        hr, hp, hy = 0.5 * roll, 0.5 * pitch, 0.5 * yaw
+        return cls(*cls._from_half_angles(math.cos(hr), math.cos(hp), math.cos(hy),
+                                          math.sin(hr), math.sin(hp), math.sin(hy)))
+    
+    @classmethod
+    def from_rpy_batch(cls, rpy: np.ndarray) -> np.ndarray:
+        """
+        Convert many roll-pitch-yaw triples at once.
+        
+        Args:
+            rpy: Array of shape (N, 3)
+        
+        Returns:
+            Array of shape (N, 4) with rows [x, y, z, w]
+        """
+        half = 0.5 * np.asarray(rpy, dtype=np.float64).reshape(-1, 3)
+        c = np.cos(half)
+        s = np.sin(half)
+        x, y, z, w = cls._from_half_angles(c[:, 0], c[:, 1], c[:, 2],
+                                           s[:, 0], s[:, 1], s[:, 2])
+        return np.stack((x, y, z, w), axis=1)
+
 
+# Shared immutable defaults; safe to reuse because Vector3/Quaternion are frozen
+_ZERO_V3 = Vector3(0.0, 0.0, 0.0)
+_UNIT_Z = Vector3(0.0, 0.0, 1.0)
+_UNIT_Q = Quaternion(0.0, 0.0, 0.0, 1.0)
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Pose:
     """6DOF pose representation."""
-    position: Vector3 = field(default_factory=Vector3)
-    orientation: Quaternion = field(default_factory=Quaternion)
+    position: Vector3 = _ZERO_V3
+    orientation: Quaternion = _UNIT_Q
     
     @classmethod
     def from_xyzrpy(cls, xyz: List[float], rpy: List[float]) -> 'Pose':
@@ -116,7 +167,7 @@ class Pose:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Inertia:
     """Inertia tensor representation."""
     ixx: float = 0.0
@@ -126,16 +177,32 @@ class Inertia:
     ixz: float = 0.0
     iyz: float = 0.0
     
+    # Last matrix built by to_matrix() and the components it was built from
+    _matrix: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False)
+    _matrix_key: Optional[Tuple[float, ...]] = field(
+        default=None, init=False, repr=False, compare=False)
+    
     def to_matrix(self) -> np.ndarray:
-        """Convert to 3x3 inertia matrix."""
-        return np.array([
-            [self.ixx, self.ixy, self.ixz],
-            [self.ixy, self.iyy, self.iyz], 
-            [self.ixz, self.iyz, self.izz]
-        ])
-
-
-@dataclass
+        """
+        Convert to 3x3 inertia matrix.
+        
+        The matrix is cached and rebuilt whenever a component has changed;
+        each call returns a fresh copy that the caller may modify.
+        """
+        key = (self.ixx, self.iyy, self.izz, self.ixy, self.ixz, self.iyz)
+        if self._matrix is None or self._matrix_key != key:
+            matrix = np.empty((3, 3))
+            matrix.flat[:] = (self.ixx, self.ixy, self.ixz,
+                              self.ixy, self.iyy, self.iyz,
+                              self.ixz, self.iyz, self.izz)
+            matrix.flags.writeable = False
+            self._matrix = matrix
+            self._matrix_key = key
+        return self._matrix.copy()
+
+
+@dataclass(**_SLOTS)
 class Material:
     """Material properties for visual and collision elements."""
     name: Optional[str] = None
@@ -146,7 +213,7 @@ class Material:
     shininess: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Geometry:
     """Geometric shape definition."""
     type: GeometryType
@@ -169,7 +236,7 @@ class Geometry:
     extensions: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Visual:
     """Visual representation of a link."""
     name: Optional[str] = None
@@ -179,7 +246,7 @@ class Visual:
     extensions: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Collision:
     """Collision representation of a link."""
     name: Optional[str] = None
@@ -196,25 +263,29 @@ class Collision:
     extensions: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Link:
     """Robot link definition."""
     name: str
     
     # Inertial properties
     mass: float = 0.0
-    center_of_mass: Vector3 = field(default_factory=Vector3)
+    center_of_mass: Vector3 = _ZERO_V3
     inertia: Inertia = field(default_factory=Inertia)
     
     # Geometric representations
     visuals: List[Visual] = field(default_factory=list)
     collisions: List[Collision] = field(default_factory=list)
     
+    # Body frame pose relative to the parent body (MJCF bodies); None
+    # when the format places links through joint origins instead
+    pose: Optional[Pose] = None
+    
     # Format-specific extensions
     extensions: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass 
+@dataclass(**_SLOTS)
 class JointLimits:
     """Joint limit specification."""
     lower: Optional[float] = None
@@ -227,7 +298,7 @@ class JointLimits:
     jerkmax: Optional[float] = None  # MJCF
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class JointDynamics:
     """Joint dynamics properties."""
     damping: float = 0.0
@@ -240,7 +311,7 @@ class JointDynamics:
     backlash: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Joint:
     """Robot joint definition."""
     name: str
@@ -250,7 +321,7 @@ class Joint:
     
     # Kinematic properties
     pose: Pose = field(default_factory=Pose)
-    axis: Vector3 = field(default_factory=lambda: Vector3(0, 0, 1))
+    axis: Vector3 = _UNIT_Z
     
     # Constraints
     limits: Optional[JointLimits] = None
@@ -264,7 +335,7 @@ class Joint:
     extensions: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Actuator:
     """Actuator/motor definition."""
     name: str
@@ -288,10 +359,14 @@ class Actuator:
     inductance: Optional[float] = None
     efficiency: Optional[float] = None
     
+    # Command and output ranges as (min, max), e.g. MJCF ctrlrange/forcerange
+    control_range: Optional[Tuple[float, float]] = None
+    force_range: Optional[Tuple[float, float]] = None
+    
     extensions: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Sensor:
     """Sensor definition."""
     name: str
@@ -310,7 +385,7 @@ class Sensor:
     extensions: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ContactSurface:
     """Contact surface properties."""
     mu_static: float = 0.8
@@ -325,7 +400,7 @@ class ContactSurface:
     soft_erp: Optional[float] = None  # Error reduction parameter
 
 
-@dataclass 
+@dataclass(**_SLOTS)
 class Contact:
     """Contact definition for collision detection."""
     name: str
@@ -334,7 +409,7 @@ class Contact:
     extensions: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Metadata:
     """Robot model metadata."""
     name: str
@@ -349,7 +424,48 @@ class Metadata:
     extensions: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
+class _LinkTable:
+    """Columnar (structure-of-arrays) snapshot of ``CommonSchema.links`` names."""
+    names: np.ndarray     # (N,) object
+    node_idx: np.ndarray  # (N,) int32, index of the first link with this name
+    
+    @classmethod
+    def from_links(cls, links: List['Link'],
+                   node_index: Dict[str, int]) -> '_LinkTable':
+        """Build the table, registering link names in ``node_index``."""
+        n = len(links)
+        names = np.empty(n, dtype=object)
+        node_idx = np.empty(n, dtype=np.int32)
+        for i, link in enumerate(links):
+            names[i] = link.name
+            node_idx[i] = node_index.setdefault(link.name, len(node_index))
+        return cls(names, node_idx)
+
+
+@dataclass(**_SLOTS)
+class _JointTable:
+    """Columnar (structure-of-arrays) snapshot of ``CommonSchema.joints`` connectivity."""
+    names: np.ndarray       # (M,) object
+    parent_idx: np.ndarray  # (M,) int32 node index of the parent link
+    child_idx: np.ndarray   # (M,) int32 node index of the child link
+    
+    @classmethod
+    def from_joints(cls, joints: List['Joint'],
+                    node_index: Dict[str, int]) -> '_JointTable':
+        """Build the table, adding names not seen yet (e.g. 'world') to ``node_index``."""
+        m = len(joints)
+        names = np.empty(m, dtype=object)
+        parent_idx = np.empty(m, dtype=np.int32)
+        child_idx = np.empty(m, dtype=np.int32)
+        for i, joint in enumerate(joints):
+            names[i] = joint.name
+            parent_idx[i] = node_index.setdefault(joint.parent_link, len(node_index))
+            child_idx[i] = node_index.setdefault(joint.child_link, len(node_index))
+        return cls(names, parent_idx, child_idx)
+
+
+@dataclass(**_SLOTS)
 class CommonSchema:
     """
     Unified robot description schema.
@@ -380,26 +496,54 @@ class CommonSchema:
     # Global extensions for format-specific features
     extensions: Dict[str, Any] = field(default_factory=dict)
     
+    # Name -> position lookups used by get_link/get_joint/get_actuator
+    _link_index: Optional[Dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _joint_index: Optional[Dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _actuator_index: Optional[Dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False)
+    
+    def invalidate_indices(self) -> None:
+        """Mark the cached name lookups dirty after editing links/joints/actuators."""
+        self._link_index = None
+        self._joint_index = None
+        self._actuator_index = None
+    
+    @staticmethod
+    def _build_index(items: List[Any]) -> Dict[str, int]:
+        """Map each name to the position of its first occurrence."""
+        index: Dict[str, int] = {}
+        for i, item in enumerate(items):
+            index.setdefault(item.name, i)
+        return index
+    
+    def _lookup(self, items: List[Any], attr: str, name: str) -> Optional[Any]:
+        """Resolve ``name`` through the cached index stored on ``attr``.
+        
+        The index is built on first use and rebuilt only after
+        invalidate_indices() marks it dirty, so call that after adding,
+        removing, renaming or replacing entries in the public lists.
+        Duplicate names resolve to their first occurrence.
+        """
+        index = getattr(self, attr)
+        if index is None:
+            index = self._build_index(items)
+            setattr(self, attr, index)
+        i = index.get(name)
+        return items[i] if i is not None else None
+    
     def get_link(self, name: str) -> Optional[Link]:
         """Get link by name."""
-        for link in self.links:
-            if link.name == name:
-                return link
-        return None
+        return self._lookup(self.links, '_link_index', name)
     
     def get_joint(self, name: str) -> Optional[Joint]:
-        """Get joint by name.""" 
-        for joint in self.joints:
-            if joint.name == name:
-                return joint
-        return None
+        """Get joint by name."""
+        return self._lookup(self.joints, '_joint_index', name)
     
     def get_actuator(self, name: str) -> Optional[Actuator]:
         """Get actuator by name."""
-        for actuator in self.actuators:
-            if actuator.name == name:
-                return actuator
-        return None
+        return self._lookup(self.actuators, '_actuator_index', name)
     
     def get_root_links(self) -> List[Link]:
         """Get links that are not children of any joint (root links)."""
@@ -408,13 +552,9 @@ class CommonSchema:
     
     def get_kinematic_tree(self) -> Dict[str, List[str]]:
         """Get kinematic tree structure as parent->children mapping."""
-        tree = {}
+        tree: Dict[str, List[str]] = {}
         for joint in self.joints:
-            parent = joint.parent_link
-            child = joint.child_link
-            if parent not in tree:
-                tree[parent] = []
-            tree[parent].append(child)
+            tree.setdefault(joint.parent_link, []).append(joint.child_link)
         return tree
     
     def validate(self) -> List[str]:
@@ -426,38 +566,74 @@ class CommonSchema:
         """
         issues = []
         
+        # Columnar snapshots of the current links/joints, local to this call
+        node_index: Dict[str, int] = {}
+        links = _LinkTable.from_links(self.links, node_index)
+        joints = _JointTable.from_joints(self.joints, node_index)
+        
         # Check for duplicate names
-        link_names = [link.name for link in self.links]
-        if len(link_names) != len(set(link_names)):
-            issues.append("Duplicate link names found")
+        link_counts = Counter(links.names)
+        for name, count in link_counts.items():
+            if count > 1:
+                issues.append(f"Duplicate link name: {name}")
         
-        joint_names = [joint.name for joint in self.joints] 
-        if len(joint_names) != len(set(joint_names)):
-            issues.append("Duplicate joint names found")
+        joint_counts = Counter(joints.names)
+        for name, count in joint_counts.items():
+            if count > 1:
+                issues.append(f"Duplicate joint name: {name}")
         
-        # Check joint references
-        for joint in self.joints:
-            if not self.get_link(joint.parent_link):
+        # Check joint references; node indices past the link names belong
+        # to names that no link carries
+        n_link_nodes = len(link_counts)
+        unknown_parent = joints.parent_idx >= n_link_nodes
+        unknown_child = joints.child_idx >= n_link_nodes
+        for i in np.flatnonzero(unknown_parent | unknown_child):
+            joint = self.joints[i]
+            if unknown_parent[i]:
                 issues.append(f"Joint '{joint.name}' references unknown parent link: {joint.parent_link}")
-            if not self.get_link(joint.child_link):
+            if unknown_child[i]:
                 issues.append(f"Joint '{joint.name}' references unknown child link: {joint.child_link}")
         
         # Check actuator references
+        known_joints = joint_counts.keys()
         for actuator in self.actuators:
-            if not self.get_joint(actuator.joint):
+            if actuator.joint not in known_joints:
                 issues.append(f"Actuator '{actuator.name}' references unknown joint: {actuator.joint}")
         
         # Check sensor references
+        known_links = link_counts.keys()
         for sensor in self.sensors:
-            if not self.get_link(sensor.parent_link):
+            if sensor.parent_link not in known_links:
                 issues.append(f"Sensor '{sensor.name}' references unknown parent link: {sensor.parent_link}")
         
-        # Check for kinematic loops (basic check)
-        try:
-            roots = self.get_root_links()
-            if len(roots) == 0:
-                issues.append("No root links found - possible kinematic loop")
-        except Exception:
-            issues.append("Error analyzing kinematic structure")
+        # Check for kinematic loops: walk the tree breadth-first from the
+        # root links and from parents that are not links (e.g. 'world')
+        is_child = np.isin(links.node_idx, joints.child_idx)
+        roots = links.names[~is_child]
+        if len(roots) == 0:
+            issues.append("No root links found - possible kinematic loop")
+        
+        tree = self.get_kinematic_tree()
+        
+        # Seed each root name once; duplicate-named links are already
+        # reported above and must not look like a loop
+        queue = deque(dict.fromkeys(roots))
+        queue.extend(parent for parent in tree if parent not in known_links)
+        if queue:
+            visited = set()
+            revisited = set()
+            while queue:
+                name = queue.popleft()
+                if name in visited:
+                    if name not in revisited:
+                        revisited.add(name)
+                        issues.append(f"Link '{name}' is reached more than once - kinematic loop or multiple parents")
+                    continue
+                visited.add(name)
+                queue.extend(tree.get(name, ()))
+            
+            for name in dict.fromkeys(links.names):
+                if name not in visited:
+                    issues.append(f"Link '{name}' is not connected to any root link - possible kinematic loop")
         
         return issues
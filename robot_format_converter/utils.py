@@ -18,6 +18,8 @@ Utility functions for format detection, validation, and conversion support.
 """
 
 import re
+import string
+import functools
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Optional, Dict, List, Any
@@ -27,6 +29,95 @@ from .schema import CommonSchema
 
 logger = logging.getLogger(__name__)
 
+# Characters outside alphanumerics, underscore and hyphen are replaced
+_SANITIZE_RE = re.compile(r'[^\w\-]')
+
+# str.translate table doing the same replacement for pure-ASCII names
+_SAFE = frozenset(string.ascii_letters + string.digits + '_-')
+_XLAT = {c: ord('_') for c in range(128) if chr(c) not in _SAFE}
+
+
+# Format descriptions; get_format_info() hands out copies
+_FORMAT_INFO: Dict[str, Dict[str, Any]] = {
+    'urdf': {
+        'name': 'Unified Robot Description Format',
+        'extensions': ['.urdf'],
+        'type': 'xml',
+        'description': 'ROS standard robot description format',
+        'features': ['kinematics', 'dynamics', 'collision', 'visual'],
+        'limitations': ['limited_sensors', 'no_actuators', 'basic_materials']
+    },
+    'sdf': {
+        'name': 'Simulation Description Format',
+        'extensions': ['.sdf', '.world'],
+        'type': 'xml', 
+        'description': 'Gazebo simulation format with advanced features',
+        'features': ['kinematics', 'dynamics', 'sensors', 'plugins', 'worlds'],
+        'limitations': ['gazebo_specific']
+    },
+    'mjcf': {
+        'name': 'MuJoCo Model Format',
+        'extensions': ['.mjcf', '.xml'],
+        'type': 'xml',
+        'description': 'MuJoCo physics simulator format',
+        'features': ['advanced_dynamics', 'constraints', 'actuators', 'sensors'],
+        'limitations': ['mujoco_specific', 'different_conventions']
+    },
+    'usd': {
+        'name': 'Universal Scene Description',
+        'extensions': ['.usd', '.usda'],
+        'type': 'binary/text',
+        'description': 'Pixar USD format for 3D content',
+        'features': ['advanced_graphics', 'animation', 'composition'],
+        'limitations': ['graphics_focused', 'limited_physics']
+    },
+    'schema': {
+        'name': 'FIGAROH Common Schema',
+        'extensions': ['.yaml', '.yml', '.json'],
+        'type': 'structured_data',
+        'description': 'Unified intermediate representation',
+        'features': ['format_agnostic', 'extensible', 'validation'],
+        'limitations': ['intermediate_format']
+    }
+}
+
+# File extensions that identify a format on their own
+_EXT_MAP = {
+    '.urdf': 'urdf',
+    '.sdf': 'sdf',
+    '.world': 'sdf',
+    '.mjcf': 'mjcf',
+    '.yaml': 'schema',
+    '.yml': 'schema',
+    '.json': 'schema',
+    '.usd': 'usd',
+    '.usda': 'usd',
+}
+
+# Extensions shared by several XML formats; the content decides
+_XML_EXTS = frozenset(('.xml',))
+
+# XML root tags that identify a format on their own
+_ROOT_TAG_FORMATS = {
+    'robot': 'urdf',
+    'sdf': 'sdf',
+    'mujoco': 'mjcf',
+    'world': 'sdf',  # SDF world file
+}
+
+# Descendant tags used to classify XML files with an unknown root
+_URDF_TAGS = frozenset(('link', 'joint', 'inertial'))
+_STRUCTURE_TAGS = _URDF_TAGS | {'model', 'worldbody', 'body'}
+
+# Marks keys absent from a dictionary in merge_extensions()
+_MISSING = object()
+
+# Units used by format_file_size(), in steps of 1024
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Built on first use by conversion_matrix(), which hands out copies
+_MATRIX: Optional[Dict[str, Dict[str, bool]]] = None
+
 
 def detect_format(file_path):
     """
@@ -34,13 +125,12 @@ def detect_format(file_path):
     
     Args:
         file_path: Path to the file to analyze (str or Path object)
-        
+    
     Returns:
         Format name string or None if format cannot be detected
     """
     # Convert string to Path object if needed
     if isinstance(file_path, str):
-        from pathlib import Path
         file_path = Path(file_path)
     
     if not file_path.exists():
@@ -48,65 +138,57 @@ def detect_format(file_path):
     
     # Check file extension first
     ext = file_path.suffix.lower()
-    ext_mapping = {
-        '.urdf': 'urdf',
-        '.sdf': 'sdf', 
-        '.world': 'sdf',
-        '.mjcf': 'mjcf',
-        '.xml': None,  # Need content analysis
-        '.yaml': 'schema',
-        '.yml': 'schema', 
-        '.json': 'schema',
-        '.usd': 'usd',
-        '.usda': 'usd',
-    }
-    
-    if ext in ext_mapping:
-        format_guess = ext_mapping[ext]
-        if format_guess is not None:
-            return format_guess
+    format_name = _EXT_MAP.get(ext)
+    if format_name is not None:
+        return format_name
     
     # Content-based detection for ambiguous extensions
-    try:
-        if ext in ['.xml', '.mjcf'] or format_guess is None:
+    if ext in _XML_EXTS:
+        try:
             return _detect_xml_format(file_path)
-        elif ext in ['.yaml', '.yml', '.json']:
-            return _detect_schema_format(file_path)
-    except Exception as e:
-        logger.debug(f"Error during content detection: {e}")
-        return None
+        except Exception as e:
+            logger.debug(f"Error during content detection: {e}")
     
     return None
 
 
 def _detect_xml_format(file_path: Path) -> Optional[str]:
-    """Detect XML-based format by analyzing root element and structure."""
+    """Detect XML-based format by analyzing root element and structure.
+    
+    The file is streamed: the root tag usually decides the format, and
+    otherwise elements are scanned only until the answer is known.
+    """
     try:
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-        
-        # Check root element tag
-        if root.tag == 'robot':
-            return 'urdf'
-        elif root.tag == 'sdf':
-            return 'sdf'
-        elif root.tag == 'mujoco':
-            return 'mjcf'
-        elif root.tag == 'world':
-            return 'sdf'  # SDF world file
+        with open(file_path, 'rb') as f:
+            events = ET.iterparse(f, events=('start', 'end'))
+            _, root = next(events)
             
-        # Check for characteristic elements
-        if root.find('.//link') is not None and root.find('.//joint') is not None:
-            if root.find('.//inertial') is not None:
-                return 'urdf'  # URDF has inertial elements
-                
-        if root.find('.//model') is not None:
-            return 'sdf'  # SDF uses model elements
+            # Check root element tag
+            format_name = _ROOT_TAG_FORMATS.get(root.tag)
+            if format_name is not None:
+                return format_name
             
-        if root.find('.//worldbody') is not None or root.find('.//body') is not None:
+            # Check for characteristic elements below the root
+            seen = set()
+            for event, elem in events:
+                if event == 'start':
+                    if elem.tag in _STRUCTURE_TAGS and elem is not root:
+                        seen.add(elem.tag)
+                        if _URDF_TAGS <= seen:
+                            break
+                else:
+                    elem.clear()
+        
+        if _URDF_TAGS <= seen:
+            return 'urdf'  # URDF has inertial elements
+        
+        if 'model' in seen:
+            return 'sdf'  # SDF uses model elements
+        
+        if 'worldbody' in seen or 'body' in seen:
             return 'mjcf'  # MuJoCo uses worldbody/body elements
-            
-    except ET.ParseError:
+    
+    except (ET.ParseError, StopIteration):
         logger.debug(f"XML parsing failed for {file_path}")
     
     return None
@@ -128,7 +210,7 @@ def validate_schema(schema: CommonSchema) -> None:
     
     Args:
         schema: CommonSchema instance to validate
-        
+    
     Raises:
         ValueError: If schema validation fails
     """
@@ -142,9 +224,19 @@ def conversion_matrix() -> Dict[str, Dict[str, bool]]:
     """
     Return conversion compatibility matrix between formats.
     
+    The matrix is built once; each call returns a fresh copy of it.
+    
     Returns:
         Nested dict indicating conversion support: matrix[source][target] = supported
     """
+    global _MATRIX
+    if _MATRIX is None:
+        _MATRIX = _build_conversion_matrix()
+    return {source: targets.copy() for source, targets in _MATRIX.items()}
+
+
+def _build_conversion_matrix() -> Dict[str, Dict[str, bool]]:
+    """Build the matrix returned by conversion_matrix()."""
     # Define which conversions are supported/recommended
     # True = full support, False = limited/lossy support
     formats = ['urdf', 'sdf', 'mjcf', 'usd', 'schema']
@@ -165,17 +257,8 @@ def conversion_matrix() -> Dict[str, Dict[str, bool]]:
                 # Cross-format conversions via schema
                 matrix[source][target] = True
     
-    # Mark some conversions as limited due to semantic differences
-    limited_conversions = [
-        ('mjcf', 'urdf'),  # MuJoCo features don't map well to URDF
-        ('usd', 'urdf'),   # USD is much more general
-        ('sdf', 'urdf'),   # SDF has features URDF lacks
-    ]
-    
-    for source, target in limited_conversions:
-        if source in matrix and target in matrix[source]:
-            # Still supported but may have limitations
-            matrix[source][target] = True
+    # mjcf/usd/sdf -> urdf are supported but lossy, since URDF lacks many
+    # of their features; the matrix has no separate "limited" state
     
     return matrix
 
@@ -186,72 +269,39 @@ def get_format_info(format_name: str) -> Dict[str, Any]:
     
     Args:
         format_name: Name of the format
-        
+    
     Returns:
-        Dictionary with format information
+        Dictionary with format information (empty if unknown); a fresh
+        copy the caller may modify
     """
-    format_info = {
-        'urdf': {
-            'name': 'Unified Robot Description Format',
-            'extensions': ['.urdf'],
-            'type': 'xml',
-            'description': 'ROS standard robot description format',
-            'features': ['kinematics', 'dynamics', 'collision', 'visual'],
-            'limitations': ['limited_sensors', 'no_actuators', 'basic_materials']
-        },
-        'sdf': {
-            'name': 'Simulation Description Format',
-            'extensions': ['.sdf', '.world'],
-            'type': 'xml', 
-            'description': 'Gazebo simulation format with advanced features',
-            'features': ['kinematics', 'dynamics', 'sensors', 'plugins', 'worlds'],
-            'limitations': ['gazebo_specific']
-        },
-        'mjcf': {
-            'name': 'MuJoCo Model Format',
-            'extensions': ['.mjcf', '.xml'],
-            'type': 'xml',
-            'description': 'MuJoCo physics simulator format',
-            'features': ['advanced_dynamics', 'constraints', 'actuators', 'sensors'],
-            'limitations': ['mujoco_specific', 'different_conventions']
-        },
-        'usd': {
-            'name': 'Universal Scene Description',
-            'extensions': ['.usd', '.usda'],
-            'type': 'binary/text',
-            'description': 'Pixar USD format for 3D content',
-            'features': ['advanced_graphics', 'animation', 'composition'],
-            'limitations': ['graphics_focused', 'limited_physics']
-        },
-        'schema': {
-            'name': 'FIGAROH Common Schema',
-            'extensions': ['.yaml', '.yml', '.json'],
-            'type': 'structured_data',
-            'description': 'Unified intermediate representation',
-            'features': ['format_agnostic', 'extensible', 'validation'],
-            'limitations': ['intermediate_format']
-        }
-    }
-    
-    return format_info.get(format_name.lower(), {})
+    info = _FORMAT_INFO.get(format_name.lower(), {})
+    return {key: value.copy() if isinstance(value, list) else value
+            for key, value in info.items()}
 
 
+@functools.lru_cache(maxsize=2048)
 def sanitize_name(name: str) -> str:
     """
     Sanitize name for cross-format compatibility.
     
+    Results are memoized since robot files reuse the same link, joint and
+    actuator names many times over.
+    
     Args:
         name: Original name string
-        
+    
     Returns:
         Sanitized name safe for all formats
     """
     # Remove/replace characters that are problematic in XML or other formats
     # Keep alphanumeric, underscore, hyphen
-    sanitized = re.sub(r'[^\w\-]', '_', name)
+    if name.isascii():
+        sanitized = name.translate(_XLAT)
+    else:
+        sanitized = _SANITIZE_RE.sub('_', name)
     
     # Ensure it starts with letter or underscore
-    if sanitized and sanitized[0].isdigit():
+    if sanitized[:1].isdigit():
         sanitized = '_' + sanitized
     
     # Handle empty results
@@ -261,29 +311,46 @@ def sanitize_name(name: str) -> str:
     return sanitized
 
 
-def merge_extensions(base_ext: Dict[str, Any], new_ext: Dict[str, Any]) -> Dict[str, Any]:
+def merge_extensions(base_ext: Dict[str, Any], new_ext: Dict[str, Any],
+                     copy: bool = True) -> Dict[str, Any]:
     """
     Merge extension dictionaries, handling conflicts appropriately.
     
     Args:
         base_ext: Base extensions dictionary
         new_ext: New extensions to merge
-        
+        copy: If False, the caller gives up ``base_ext``: it is updated in
+            place (nested dictionaries included) and may be returned as is,
+            and ``new_ext`` may be returned when ``base_ext`` is empty
+    
     Returns:
         Merged extensions dictionary
     """
-    merged = base_ext.copy()
-    
-    for key, value in new_ext.items():
-        if key in merged:
-            if isinstance(merged[key], dict) and isinstance(value, dict):
-                # Recursively merge nested dictionaries
-                merged[key] = merge_extensions(merged[key], value)
+    # Nothing to merge on one side (most links carry no extensions)
+    if not new_ext:
+        return base_ext.copy() if copy else base_ext
+    if not base_ext:
+        return new_ext.copy() if copy else new_ext
+    
+    merged = base_ext.copy() if copy else base_ext
+    
+    # Walk nested dictionaries with an explicit stack of (target, source)
+    # pairs; with copy=True targets are copies, so base_ext is not modified
+    stack = [(merged, new_ext)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            existing = target.get(key, _MISSING)
+            if isinstance(existing, dict) and isinstance(value, dict):
+                # Merge nested dictionaries
+                if not value:
+                    continue
+                if copy:
+                    target[key] = existing = existing.copy()
+                stack.append((existing, value))
             else:
                 # New value overwrites existing
-                merged[key] = value
-        else:
-            merged[key] = value
+                target[key] = value
     
     return merged
 
@@ -295,15 +362,7 @@ def get_supported_conversions() -> List[tuple]:
     Returns:
         List of (source_format, target_format) tuples
     """
-    matrix = conversion_matrix()
-    conversions = []
-    
-    for source, targets in matrix.items():
-        for target, supported in targets.items():
-            if supported and source != target:
-                conversions.append((source, target))
-    
-    return conversions
+    return list(_SUPPORTED_CONVERSIONS)
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -312,15 +371,27 @@ def format_file_size(size_bytes: int) -> str:
     
     Args:
         size_bytes: Size in bytes
-        
+    
     Returns:
         Formatted size string
     """
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
+    
+    # Each unit step is 10 bits; TB is the largest unit used
+    exponent = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * exponent)):.1f} {_SIZE_UNITS[exponent]}"
+
+
+def _compare_names(first: List[Any], second: List[Any]) -> Dict[str, set]:
+    """Split the names of two element lists into exclusive and common sets."""
+    names1 = {item.name for item in first}
+    names2 = {item.name for item in second}
+    return {
+        'only_in_first': names1 - names2,
+        'only_in_second': names2 - names1,
+        'common': names1 & names2,
+    }
 
 
 def compare_schemas(schema1: CommonSchema, schema2: CommonSchema) -> Dict[str, Any]:
@@ -330,7 +401,7 @@ def compare_schemas(schema1: CommonSchema, schema2: CommonSchema) -> Dict[str, A
     Args:
         schema1: First schema to compare
         schema2: Second schema to compare
-        
+    
     Returns:
         Dictionary describing differences between schemas
     """
@@ -352,22 +423,16 @@ def compare_schemas(schema1: CommonSchema, schema2: CommonSchema) -> Dict[str, A
     }
     
     # Compare names
-    schema1_link_names = {link.name for link in schema1.links}
-    schema2_link_names = {link.name for link in schema2.links}
-    
-    differences['links'] = {
-        'only_in_first': schema1_link_names - schema2_link_names,
-        'only_in_second': schema2_link_names - schema1_link_names,
-        'common': schema1_link_names & schema2_link_names
-    }
-    
-    schema1_joint_names = {joint.name for joint in schema1.joints}
-    schema2_joint_names = {joint.name for joint in schema2.joints}
-    
-    differences['joints'] = {
-        'only_in_first': schema1_joint_names - schema2_joint_names,
-        'only_in_second': schema2_joint_names - schema1_joint_names,
-        'common': schema1_joint_names & schema2_joint_names
-    }
+    differences['links'] = _compare_names(schema1.links, schema2.links)
+    differences['joints'] = _compare_names(schema1.joints, schema2.joints)
     
     return differences
+
+
+# The conversion matrix is static, so the supported pairs are listed once
+_SUPPORTED_CONVERSIONS = tuple(
+    (source, target)
+    for source, targets in _build_conversion_matrix().items()
+    for target, supported in targets.items()
+    if supported and source != target
+)
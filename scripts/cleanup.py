@@ -4,7 +4,9 @@ Project cleanup and organization script.
 """
 
 import os
+import re
 import shutil
+import sys
 from pathlib import Path
 import logging
 
@@ -12,46 +14,63 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Cleanup rules, matched against entry names while walking the project once
+# Python cache artifacts at any depth
+_CACHE_RE = re.compile(r'__pycache__|.*\.py[cod]', re.DOTALL)
+
+# Build artifacts and IDE directories in the project root
+_ROOT_DIR_RE = re.compile(r'build|dist|\.vscode|\.idea|.*\.egg-info', re.DOTALL)
+
+# IDE, OS and temporary files in the project root
+_ROOT_FILE_RE = re.compile(
+    r'\.DS_Store|Thumbs\.db|.*\.(tmp|temp|log)|.*\.sublime-.*', re.DOTALL)
+
+# Example outputs left directly in examples/ (keep organized outputs)
+_EXAMPLE_RE = re.compile(r'.*\.(urdf|xml|json|txt)', re.DOTALL)
+
+
+def _rmtree(path):
+    """Remove a directory tree, logging each entry that cannot be removed.
+    
+    Removal continues past failures instead of stopping at the first one.
+    Returns True if everything was removed.
+    """
+    failures = []
+    
+    def onexc(func, failed_path, exc):
+        failures.append(failed_path)
+        logger.warning("Failed to remove %s: %s", failed_path, exc)
+    
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=onexc)
+    else:
+        shutil.rmtree(path, onerror=lambda func, failed_path, exc_info:
+                      onexc(func, failed_path, exc_info[1]))
+    return not failures
+
+
+def _is_cleanup_target(rel_dir, name, is_dir):
+    """Tell whether entry ``name`` of directory ``rel_dir`` should be removed.
+    
+    ``rel_dir`` is relative to the project root ('.' for the root itself).
+    """
+    if _CACHE_RE.fullmatch(name):
+        return True
+    if rel_dir == ".":
+        if is_dir and _ROOT_DIR_RE.fullmatch(name):
+            return True
+        return _ROOT_FILE_RE.fullmatch(name) is not None
+    if rel_dir == "examples":
+        return _EXAMPLE_RE.fullmatch(name) is not None
+    return False
+
+
 def cleanup_project():
     """Clean up the robot format converter project."""
     
     project_root = Path(__file__).parent.parent
     logger.info(f"Cleaning up project at: {project_root}")
     
-    # Files and directories to remove
-    cleanup_targets = [
-        # Python cache
-        "**/__pycache__",
-        "**/*.pyc", 
-        "**/*.pyo",
-        "**/*.pyd",
-        
-        # Build artifacts
-        "build/",
-        "dist/",
-        "*.egg-info/",
-        
-        # IDE files
-        ".vscode/",
-        ".idea/",
-        "*.sublime-*",
-        
-        # OS files
-        ".DS_Store",
-        "Thumbs.db",
-        
-        # Temporary files
-        "*.tmp",
-        "*.temp",
-        "*.log",
-        
-        # Example outputs (keep organized outputs)
-        "examples/*.urdf",
-        "examples/*.xml", 
-        "examples/*.json",
-        "examples/*.txt",
-    ]
-    
     # Specific files to remove
     specific_files = [
         "examples/ur_description",  # Redundant with universal_robots_ur10e
@@ -65,36 +84,66 @@ def cleanup_project():
     files_removed = 0
     dirs_removed = 0
     
-    # Remove matching patterns
-    for pattern in cleanup_targets:
-        for path in project_root.glob(pattern):
+    # Remove matching entries in a single walk; DirEntry caches the entry
+    # type from the directory listing, and removed directories are never
+    # listed themselves
+    stack = [(str(project_root), ".")]
+    while stack:
+        dirpath, rel_dir = stack.pop()
+        
+        # Stream the listing, keeping only the matches; they are removed
+        # once the directory handle is closed
+        targets = []
+        try:
+            with os.scandir(dirpath) as entries:
+                for entry in entries:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if _is_cleanup_target(rel_dir, entry.name, is_dir):
+                        targets.append((entry.path, is_dir))
+                    elif is_dir:
+                        child_rel = entry.name if rel_dir == "." else os.path.join(rel_dir, entry.name)
+                        stack.append((entry.path, child_rel))
+        except OSError as e:
+            logger.warning(f"Failed to scan {dirpath}: {e}")
+        
+        # Log with %-style arguments so nothing is formatted unless debug
+        # output is enabled
+        for entry_path, is_dir in targets:
             try:
-                if path.is_file():
-                    path.unlink()
+                if is_dir:
+                    if _rmtree(entry_path):
+                        dirs_removed += 1
+                        logger.debug("Removed directory: %s", entry_path)
+                else:
+                    os.unlink(entry_path)
                     files_removed += 1
-                    logger.debug(f"Removed file: {path.relative_to(project_root)}")
-                elif path.is_dir():
-                    shutil.rmtree(path)
-                    dirs_removed += 1
-                    logger.debug(f"Removed directory: {path.relative_to(project_root)}")
+                    logger.debug("Removed file: %s", entry_path)
             except Exception as e:
-                logger.warning(f"Failed to remove {path}: {e}")
+                logger.warning(f"Failed to remove {entry_path}: {e}")
     
     # Remove specific files
     for file_path in specific_files:
         full_path = project_root / file_path
-        if full_path.exists():
+        try:
+            # Try the removal directly; a missing path is the common case
             try:
-                if full_path.is_file():
-                    full_path.unlink()
-                    files_removed += 1
-                    logger.info(f"Removed redundant file: {file_path}")
-                elif full_path.is_dir():
-                    shutil.rmtree(full_path)
-                    dirs_removed += 1
-                    logger.info(f"Removed redundant directory: {file_path}")
-            except Exception as e:
-                logger.warning(f"Failed to remove {full_path}: {e}")
+                os.unlink(full_path)
+                files_removed += 1
+                logger.info(f"Removed redundant file: {file_path}")
+                continue
+            except FileNotFoundError:
+                continue
+            except IsADirectoryError:
+                pass
+            except PermissionError:
+                # macOS reports unlink() on a directory as EPERM
+                if not full_path.is_dir():
+                    raise
+            if _rmtree(full_path):
+                dirs_removed += 1
+                logger.info(f"Removed redundant directory: {file_path}")
+        except Exception as e:
+            logger.warning(f"Failed to remove {full_path}: {e}")
     
     logger.info(f"Cleanup completed: {files_removed} files, {dirs_removed} directories removed")
 
@@ -129,33 +178,40 @@ def organize_examples():
         category_dir = examples_dir / category
         category_dir.mkdir(exist_ok=True)
     
+    # One listing of the examples directory answers both "does it exist"
+    # and "is it a directory" for every source
+    with os.scandir(examples_dir) as entries:
+        present = {entry.name: entry.is_dir(follow_symlinks=False) for entry in entries}
+    
     # Move files to appropriate categories
     for category, files in categories.items():
         for file_name in files:
             src = examples_dir / file_name
             dst = examples_dir / category / file_name
             
-            if src.exists() and src != dst:
-                try:
-                    if src.is_dir():
-                        if dst.exists():
-                            shutil.rmtree(dst)
-                        shutil.move(str(src), str(dst))
-                    else:
-                        dst.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.move(str(src), str(dst))
-                    
-                    logger.info(f"Moved {file_name} to {category}")
-                except Exception as e:
-                    logger.warning(f"Failed to move {file_name}: {e}")
+            is_dir = present.get(src.name)
+            if is_dir is None or src == dst:
+                continue
+            
+            try:
+                if is_dir:
+                    try:
+                        shutil.rmtree(dst)
+                    except FileNotFoundError:
+                        pass
+                    shutil.move(str(src), str(dst))
+                else:
+                    # Same directory tree, so a plain rename always works;
+                    # the category directory was created above
+                    os.replace(src, dst)
+                
+                logger.info(f"Moved {file_name} to {category}")
+            except Exception as e:
+                logger.warning(f"Failed to move {file_name}: {e}")
 
 
-def create_project_structure_doc():
-    """Create documentation of the organized project structure."""
-    
-    project_root = Path(__file__).parent.parent
-    
-    structure_doc = """# Robot Format Converter - Project Structure
+# Contents written to PROJECT_STRUCTURE.md by create_project_structure_doc()
+_PROJECT_STRUCTURE_DOC = """# Robot Format Converter - Project Structure
 
 ## Overview
 This document describes the organized structure of the robot format converter project.
@@ -261,11 +317,16 @@ The converter is designed for extensibility:
 - **Testing**: pytest, unittest
 - **Development**: black, flake8, mypy
 """
+
+
+def create_project_structure_doc():
+    """Create documentation of the organized project structure."""
+    
+    project_root = Path(__file__).parent.parent
     
     # Save structure documentation
     structure_file = project_root / "PROJECT_STRUCTURE.md"
-    with open(structure_file, 'w') as f:
-        f.write(structure_doc)
+    structure_file.write_text(_PROJECT_STRUCTURE_DOC, encoding='utf-8')
     
     logger.info("Created project structure documentation: PROJECT_STRUCTURE.md")
 
@@ -10,12 +10,16 @@ Author: Thanh D.V. Nguyen
 Date: September 2025
 """
 
+import os
 import sys
 import argparse
 import logging
 from pathlib import Path
 from typing import Dict, Any, List
 import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 # Configure logging
 logging.basicConfig(
@@ -24,6 +28,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Model file extensions handled by the validators, in processing order
+MODEL_EXTENSIONS = ('.urdf', '.xml')
+
 
 class ModelValidator:
     """Base class for model validation and visualization."""
@@ -47,33 +54,45 @@ class ModelValidator:
 class URDFValidator(ModelValidator):
     """URDF model validator using Pinocchio and PyBullet."""
     
+    # Modules imported on first use and shared by all instances; Pinocchio
+    # is only needed to validate and PyBullet only to visualize
+    _pin = None
+    _pybullet = None
+    
     def __init__(self, model_path: str):
         super().__init__(model_path)
         self.robot_pinocchio = None
         self.robot_pybullet = None
-        
-        # Check dependencies
-        self._check_dependencies()
     
-    def _check_dependencies(self):
-        """Check if required dependencies are available."""
-        try:
-            import pinocchio as pin
-            self.pin = pin
-        except ImportError:
-            raise ImportError(
-                "Pinocchio is required for URDF validation. "
-                "Install with: pip install pin"
-            )
-        
-        try:
-            import pybullet as p
-            self.pybullet = p
-        except ImportError:
-            raise ImportError(
-                "PyBullet is required for URDF visualization. "
-                "Install with: pip install pybullet"
-            )
+    @property
+    def pin(self):
+        """The pinocchio module, imported on first access."""
+        cls = type(self)
+        if cls._pin is None:
+            try:
+                import pinocchio
+            except ImportError:
+                raise ImportError(
+                    "Pinocchio is required for URDF validation. "
+                    "Install with: pip install pin"
+                )
+            cls._pin = pinocchio
+        return cls._pin
+    
+    @property
+    def pybullet(self):
+        """The pybullet module, imported on first access."""
+        cls = type(self)
+        if cls._pybullet is None:
+            try:
+                import pybullet
+            except ImportError:
+                raise ImportError(
+                    "PyBullet is required for URDF visualization. "
+                    "Install with: pip install pybullet"
+                )
+            cls._pybullet = pybullet
+        return cls._pybullet
     
     def validate(self) -> Dict[str, Any]:
         """Validate URDF model using Pinocchio."""
@@ -90,9 +109,10 @@ class URDFValidator(ModelValidator):
         
         try:
             # Load with Pinocchio
-            self.robot_pinocchio = self.pin.RobotWrapper.BuildFromURDF(
-                str(self.model_path)
-            )
+            if self.robot_pinocchio is None:
+                self.robot_pinocchio = self.pin.RobotWrapper.BuildFromURDF(
+                    str(self.model_path)
+                )
             
             # Basic validation checks
             model = self.robot_pinocchio.model
@@ -115,31 +135,31 @@ class URDFValidator(ModelValidator):
             if model.nv == 0:
                 results['warnings'].append("Model has no degrees of freedom")
             
-            # Check joint limits
-            joint_limits_ok = True
-            for i in range(1, model.njoints):
-                upper_lim = model.upperPositionLimit[i - 1]
-                lower_lim = model.lowerPositionLimit[i - 1]
-                if upper_lim <= lower_lim:
-                    results['warnings'].append(
-                        f"Invalid joint limits for joint {model.names[i]}"
-                    )
-                    joint_limits_ok = False
+            # Check joint limits (joint i uses limit entry i - 1)
+            n_moving = model.njoints - 1
+            upper = np.asarray(model.upperPositionLimit)[:n_moving]
+            lower = np.asarray(model.lowerPositionLimit)[:n_moving]
+            bad_limits = np.flatnonzero(upper <= lower)
+            for k in bad_limits.tolist():
+                results['warnings'].append(
+                    f"Invalid joint limits for joint {model.names[k + 1]}"
+                )
             
-            results['info']['joint_limits_valid'] = joint_limits_ok
+            results['info']['joint_limits_valid'] = bad_limits.size == 0
             
             # Check inertial properties
-            inertia_ok = True
-            for i in range(1, model.njoints):
-                inertia = model.inertias[i]
-                if inertia.mass <= 0:
-                    results['warnings'].append(
-                        f"Non-positive mass for body {model.names[i]}: "
-                        f"{inertia.mass}"
-                    )
-                    inertia_ok = False
+            masses = np.fromiter(
+                (model.inertias[i].mass for i in range(1, model.njoints)),
+                dtype=float, count=n_moving
+            )
+            bad_masses = np.flatnonzero(masses <= 0)
+            for k in bad_masses.tolist():
+                results['warnings'].append(
+                    f"Non-positive mass for body {model.names[k + 1]}: "
+                    f"{masses[k]}"
+                )
             
-            results['info']['inertia_valid'] = inertia_ok
+            results['info']['inertia_valid'] = bad_masses.size == 0
             results['valid'] = True
             
             logger.info("✅ URDF validation successful")
@@ -173,45 +193,53 @@ class URDFValidator(ModelValidator):
             num_joints = self.pybullet.getNumJoints(robot_id)
             logger.info(f"Loaded robot with {num_joints} joints")
             
-            # Print joint information
-            joint_info = []
+            # Print joint information, keeping the fields the animation
+            # needs as parallel arrays
+            joint_types = np.empty(num_joints, dtype=int)
+            lower_limits = np.empty(num_joints)
+            upper_limits = np.empty(num_joints)
             for i in range(num_joints):
                 info = self.pybullet.getJointInfo(robot_id, i)
-                joint_info.append({
-                    'index': i,
-                    'name': info[1].decode('utf-8'),
-                    'type': info[2],
-                    'lower_limit': info[8],
-                    'upper_limit': info[9]
-                })
+                joint_types[i] = info[2]
+                lower_limits[i] = info[8]
+                upper_limits[i] = info[9]
                 joint_name = info[1].decode('utf-8')
                 logger.info(f"   Joint {i}: {joint_name} (type: {info[2]})")
             
-            # Animate joints if possible
-            start_time = time.time()
-            t = 0
-            
-            while time.time() - start_time < duration:
+            # Revolute/prismatic joints with a usable range are the only
+            # ones animated; their limits do not change during the loop
+            moving = np.flatnonzero(
+                np.isin(joint_types, (0, 1)) & (upper_limits > lower_limits)
+            )
+            moving_lower = lower_limits[moving]
+            moving_half_range = 0.5 * (upper_limits[moving] - moving_lower)
+            moving = moving.tolist()
+            
+            # Animate joints if possible, stepping at 240 Hz against a
+            # monotonic clock; each step sleeps only until its own deadline,
+            # so slow steps do not accumulate drift
+            dt = 1. / 240.
+            start_time = time.monotonic()
+            step = 0
+            
+            while time.monotonic() - start_time < duration:
+                t = step * dt
+                
                 # Simple sinusoidal joint motion
-                for joint in joint_info:
-                    if joint['type'] in [0, 1]:  # Revolute or prismatic
-                        upper = joint['upper_limit']
-                        lower = joint['lower_limit']
-                        joint_range = upper - lower
-                        if joint_range > 0:
-                            motion_factor = 1 + 0.5 * (1 + t * 0.5)
-                            target_pos = (
-                                lower + 0.5 * joint_range * motion_factor
-                            )
-                            self.pybullet.setJointMotorControl2(
-                                robot_id, joint['index'],
-                                self.pybullet.POSITION_CONTROL,
-                                target_pos
-                            )
+                motion_factor = 1 + 0.5 * (1 + t * 0.5)
+                targets = moving_lower + moving_half_range * motion_factor
+                for i, target_pos in zip(moving, targets.tolist()):
+                    self.pybullet.setJointMotorControl2(
+                        robot_id, i,
+                        self.pybullet.POSITION_CONTROL,
+                        target_pos
+                    )
                 
                 self.pybullet.stepSimulation()
-                time.sleep(1. / 240.)  # 240 Hz
-                t += 1. / 240.
+                step += 1
+                slack = start_time + step * dt - time.monotonic()
+                if slack > 0:
+                    time.sleep(slack)
             
             logger.info("✅ PyBullet visualization completed")
             
@@ -227,23 +255,33 @@ class URDFValidator(ModelValidator):
 class MJCFValidator(ModelValidator):
     """MJCF model validator using MuJoCo."""
     
+    # MuJoCo module, imported on first use and shared by all instances
+    _mujoco = None
+    
     def __init__(self, model_path: str):
         super().__init__(model_path)
         self.model = None
-        
-        # Check dependencies
-        self._check_dependencies()
     
-    def _check_dependencies(self):
-        """Check if MuJoCo is available."""
-        try:
-            import mujoco
-            self.mujoco = mujoco
-        except ImportError:
-            raise ImportError(
-                "MuJoCo is required for MJCF validation. "
-                "Install with: pip install mujoco"
-            )
+    @property
+    def mujoco(self):
+        """The mujoco module, imported on first access."""
+        cls = type(self)
+        if cls._mujoco is None:
+            try:
+                import mujoco
+            except ImportError:
+                raise ImportError(
+                    "MuJoCo is required for MJCF validation. "
+                    "Install with: pip install mujoco"
+                )
+            cls._mujoco = mujoco
+        return cls._mujoco
+    
+    def _load_model(self):
+        """Compile the MJCF file once per validator."""
+        if self.model is None:
+            self.model = self.mujoco.MjModel.from_xml_path(str(self.model_path))
+        return self.model
     
     def validate(self) -> Dict[str, Any]:
         """Validate MJCF model using MuJoCo."""
@@ -260,9 +298,7 @@ class MJCFValidator(ModelValidator):
         
         try:
             # Load model
-            self.model = self.mujoco.MjModel.from_xml_path(
-                str(self.model_path)
-            )
+            self.model = self._load_model()
             
             # Extract model information
             results['info'].update({
@@ -275,17 +311,14 @@ class MJCFValidator(ModelValidator):
                 'sensors': self.model.nsensor
             })
             
-            # Get body names
+            # Get body names from the null-separated names buffer
+            names = bytes(self.model.names)
             body_names = []
-            for i in range(self.model.nbody):
-                name_start = self.model.name_bodyadr[i]
-                name_end = name_start
-                while (name_end < len(self.model.names) and
-                       self.model.names[name_end] != 0):
-                    name_end += 1
-                name_bytes = self.model.names[name_start:name_end].tobytes()
-                body_name = name_bytes.decode('utf-8')
-                body_names.append(body_name)
+            for name_start in self.model.name_bodyadr.tolist():
+                name_end = names.find(b'\x00', name_start)
+                if name_end < 0:
+                    name_end = len(names)
+                body_names.append(names[name_start:name_end].decode('utf-8'))
             
             results['info']['body_names'] = body_names
             
@@ -325,10 +358,7 @@ class MJCFValidator(ModelValidator):
         logger.info(f"Visualizing MJCF model with MuJoCo for {duration}s")
         
         try:
-            if self.model is None:
-                self.model = self.mujoco.MjModel.from_xml_path(
-                    str(self.model_path)
-                )
+            self._load_model()
             
             # Create data
             data = self.mujoco.MjData(self.model)
@@ -338,22 +368,7 @@ class MJCFValidator(ModelValidator):
                 import mujoco.viewer
                 
                 with mujoco.viewer.launch_passive(self.model, data) as viewer:
-                    start_time = time.time()
-                    
-                    while time.time() - start_time < duration:
-                        # Simple sinusoidal control
-                        t = time.time() - start_time
-                        
-                        # Apply simple joint control if actuators exist
-                        if self.model.nu > 0:
-                            for i in range(self.model.nu):
-                                # Slow motion
-                                data.ctrl[i] = 0.5 * (1 + 0.5 * t)
-                        
-                        # Step simulation
-                        self.mujoco.mj_step(self.model, data)
-                        viewer.sync()
-                        time.sleep(0.01)
+                    self._run_realtime(data, duration, viewer)
                 
             except ImportError:
                 logger.warning(
@@ -361,15 +376,49 @@ class MJCFValidator(ModelValidator):
                 )
                 
                 # Run headless simulation
-                start_time = time.time()
-                while time.time() - start_time < duration:
-                    self.mujoco.mj_step(self.model, data)
-                    time.sleep(0.01)
+                self._run_realtime(data, duration)
             
             logger.info("✅ MuJoCo visualization completed")
             
         except Exception as e:
             logger.error(f"❌ MuJoCo visualization failed: {str(e)}")
+    
+    def _run_realtime(self, data, duration: float, viewer=None) -> None:
+        """Simulate for ``duration`` seconds, keeping pace with the wall clock.
+        
+        Each frame steps the model until simulated time catches up with
+        elapsed time, so the motion plays at real speed whatever
+        ``opt.timestep`` is, then syncs the viewer (if any) and sleeps off
+        the rest of the frame.
+        """
+        timestep = self.model.opt.timestep
+        if timestep <= 0:
+            raise ValueError(f"Invalid timestep: {timestep}")
+        
+        frame = 1. / 60.
+        start_time = time.monotonic()
+        sim_time = 0.0
+        
+        while True:
+            t = time.monotonic() - start_time
+            if t >= duration:
+                break
+            
+            # Apply simple joint control (slow motion) if actuators exist
+            if self.model.nu > 0:
+                data.ctrl[:] = 0.5 * (1 + 0.5 * t)
+            
+            # Step simulation
+            while sim_time < t:
+                self.mujoco.mj_step(self.model, data)
+                sim_time += timestep
+            
+            if viewer is not None:
+                viewer.sync()
+            
+            slack = start_time + t + frame - time.monotonic()
+            if slack > 0:
+                time.sleep(slack)
 
 
 def create_validator(model_path: str) -> ModelValidator:
@@ -389,16 +438,58 @@ def create_validator(model_path: str) -> ModelValidator:
 
 def find_models(directory: str) -> List[str]:
     """Find all model files in a directory."""
-    models = []
     path = Path(directory)
     
     if path.is_file():
         return [str(path)]
     
-    for ext in ['*.urdf', '*.xml']:
-        models.extend(path.rglob(ext))
+    # Walk the tree once, grouping URDF models before MJCF ones
+    found = {ext: [] for ext in MODEL_EXTENSIONS}
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            models = found.get(os.path.splitext(filename)[1].lower())
+            if models is not None:
+                models.append(os.path.join(dirpath, filename))
     
-    return [str(model) for model in models]
+    return [model for models in found.values() for model in models]
+
+
+def _validate_one(model_path: str) -> Dict[str, Any]:
+    """Validate a single model; used as the worker for parallel runs."""
+    try:
+        return create_validator(model_path).validate()
+    except Exception as e:
+        logger.error(f"❌ Failed to process {model_path}: {str(e)}")
+        return {
+            'model_path': model_path,
+            'valid': False,
+            'errors': [str(e)]
+        }
+
+
+def _print_result(result: Dict[str, Any]) -> None:
+    """Print the validation results of one model."""
+    print(f"\n📋 Validation Results for {result['model_type']}:")
+    print(f"   Model: {Path(result['model_path']).name}")
+    print(f"   Valid: {'✅ Yes' if result['valid'] else '❌ No'}")
+    
+    if result['errors']:
+        print(f"   Errors: {len(result['errors'])}")
+        for error in result['errors']:
+            print(f"     - {error}")
+    
+    if result['warnings']:
+        print(f"   Warnings: {len(result['warnings'])}")
+        for warning in result['warnings']:
+            print(f"     - {warning}")
+    
+    if result['info']:
+        print(f"   Info:")
+        for key, value in result['info'].items():
+            if isinstance(value, list) and len(value) > 5:
+                print(f"     - {key}: {len(value)} items")
+            else:
+                print(f"     - {key}: {value}")
 
 
 def main():
@@ -454,56 +545,42 @@ Examples:
     logger.info(f"Found {len(model_paths)} model(s)")
     
     # Process each model
-    results = []
-    
-    for model_path in model_paths:
-        logger.info(f"\n{'=' * 60}")
-        logger.info(f"Processing: {model_path}")
-        logger.info(f"{'=' * 60}")
-        
-        try:
-            # Create validator
-            validator = create_validator(model_path)
-            
-            # Validate
-            result = validator.validate()
-            results.append(result)
-            
-            # Print validation results
-            print(f"\n📋 Validation Results for {result['model_type']}:")
-            print(f"   Model: {Path(result['model_path']).name}")
-            print(f"   Valid: {'✅ Yes' if result['valid'] else '❌ No'}")
-            
-            if result['errors']:
-                print(f"   Errors: {len(result['errors'])}")
-                for error in result['errors']:
-                    print(f"     - {error}")
-            
-            if result['warnings']:
-                print(f"   Warnings: {len(result['warnings'])}")
-                for warning in result['warnings']:
-                    print(f"     - {warning}")
-            
-            if result['info']:
-                print(f"   Info:")
-                for key, value in result['info'].items():
-                    if isinstance(value, list) and len(value) > 5:
-                        print(f"     - {key}: {len(value)} items")
-                    else:
-                        print(f"     - {key}: {value}")
-            
-            # Visualize if requested and validation successful
-            if not args.validate_only and result['valid']:
-                print(f"\n🎬 Starting visualization...")
-                validator.visualize(args.duration)
+    if args.validate_only and len(model_paths) > 1:
+        # Validation of separate files is independent and CPU-bound, so fan
+        # it out over processes; results keep the order of model_paths
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(_validate_one, model_paths))
+        for result in results:
+            if 'model_type' in result:
+                _print_result(result)
+    else:
+        results = []
+        for model_path in model_paths:
+            logger.info(f"\n{'=' * 60}")
+            logger.info(f"Processing: {model_path}")
+            logger.info(f"{'=' * 60}")
             
-        except Exception as e:
-            logger.error(f"❌ Failed to process {model_path}: {str(e)}")
-            results.append({
-                'model_path': model_path,
-                'valid': False,
-                'errors': [str(e)]
-            })
+            try:
+                # Create validator
+                validator = create_validator(model_path)
+                
+                # Validate
+                result = validator.validate()
+                results.append(result)
+                _print_result(result)
+                
+                # Visualize if requested and validation successful
+                if not args.validate_only and result['valid']:
+                    print(f"\n🎬 Starting visualization...")
+                    validator.visualize(args.duration)
+                
+            except Exception as e:
+                logger.error(f"❌ Failed to process {model_path}: {str(e)}")
+                results.append({
+                    'model_path': model_path,
+                    'valid': False,
+                    'errors': [str(e)]
+                })
     
     # Summary
     valid_count = sum(1 for r in results if r['valid'])
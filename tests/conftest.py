@@ -16,19 +16,13 @@
 """Test configuration and fixtures."""
 
 import pytest
-import tempfile
 from pathlib import Path
-from typing import Generator
 
+from robot_format_converter.parsers import URDFParser
+from robot_format_converter.schema import CommonSchema
 
-@pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        yield Path(tmp_dir)
 
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_urdf() -> str:
     """Sample URDF content for testing."""
     return '''<?xml version="1.0"?>
@@ -83,66 +77,15 @@ def sample_urdf() -> str:
 </robot>'''
 
 
-@pytest.fixture
-def sample_schema() -> dict:
-    """Sample schema data for testing."""
-    return {
-        "metadata": {
-            "name": "test_robot",
-            "version": "1.0",
-            "author": "Test Author",
-            "description": "A test robot"
-        },
-        "links": [
-            {
-                "name": "base_link",
-                "inertial": {
-                    "mass": 1.0,
-                    "center_of_mass": [0, 0, 0],
-                    "inertia_matrix": [0.1, 0, 0, 0.1, 0, 0.1]
-                },
-                "visual": {
-                    "geometry": {
-                        "type": "box",
-                        "size": [0.1, 0.1, 0.1]
-                    },
-                    "material": {
-                        "color": [1, 0, 0, 1]
-                    }
-                },
-                "collision": {
-                    "geometry": {
-                        "type": "box", 
-                        "size": [0.1, 0.1, 0.1]
-                    }
-                }
-            }
-        ],
-        "joints": [
-            {
-                "name": "joint1",
-                "type": "revolute",
-                "parent": "base_link",
-                "child": "link1",
-                "origin": {
-                    "xyz": [0, 0, 0.1],
-                    "rpy": [0, 0, 0]
-                },
-                "axis": [0, 0, 1],
-                "limits": {
-                    "lower": -3.14,
-                    "upper": 3.14,
-                    "effort": 10,
-                    "velocity": 1
-                }
-            }
-        ]
-    }
-
-
-@pytest.fixture
-def sample_urdf_file(temp_dir: Path, sample_urdf: str) -> Path:
+@pytest.fixture(scope="session")
+def sample_urdf_file(tmp_path_factory: pytest.TempPathFactory, sample_urdf: str) -> Path:
     """Create temporary URDF file."""
-    urdf_file = temp_dir / "test_robot.urdf"
-    urdf_file.write_text(sample_urdf)
+    urdf_file = tmp_path_factory.mktemp("data") / "test_robot.urdf"
+    urdf_file.write_bytes(sample_urdf.encode("ascii"))
     return urdf_file
+
+
+@pytest.fixture(scope="session")
+def parsed_simple_urdf(sample_urdf_file: Path) -> CommonSchema:
+    """Sample URDF parsed once per session; treat as read-only."""
+    return URDFParser().parse(sample_urdf_file)
@@ -1,33 +1,24 @@
 #!/usr/bin/env python3
 """
-Run all consolidated parser tests.
-This replaces the individual test files with a comprehensive test suite.
+Run the full test suite in-process with pytest.
+Tests are spread across worker processes when pytest-xdist is installed.
 """
 
+import importlib.util
 import sys
-import unittest
 from pathlib import Path
 
+import pytest
+
 # Add the project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-# Import test modules
-from tests.test_consolidated_parsers import *
-
 if __name__ == '__main__':
-    # Discover and run all tests
-    loader = unittest.TestLoader()
-    
-    # Load tests from consolidated test module
-    suite = unittest.TestSuite()
-    
-    # Add all test cases from consolidated parsers
-    suite.addTests(loader.loadTestsFromModule(sys.modules['tests.test_consolidated_parsers']))
+    args = ["-q", str(Path(__file__).parent)]
     
-    # Run the tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    # Parallelize across CPUs when pytest-xdist is available
+    if importlib.util.find_spec("xdist") is not None:
+        args += ["-n", "auto"]
     
-    # Exit with appropriate code
-    sys.exit(0 if result.wasSuccessful() else 1)
+    sys.exit(pytest.main(args + sys.argv[1:]))
@@ -15,13 +15,14 @@
 
 """Tests for the core conversion engine."""
 
+import os
 import pytest
 from pathlib import Path
 
 from robot_format_converter.core import (
     BaseParser, BaseExporter, ConversionEngine, FormatConverter
 )
-from robot_format_converter.schema import CommonSchema
+from robot_format_converter.schema import CommonSchema, Metadata
 
 
 class TestBaseParser:
@@ -38,6 +39,53 @@ class TestBaseParser:
             parser.parse("test.txt")
 
 
+class CachingParser(BaseParser):
+    """Parser subclass that skips BaseParser.__init__."""
+    
+    def __init__(self):
+        pass
+    
+    def can_parse(self, file_path: str) -> bool:
+        return True
+    
+    def parse(self, file_path: str) -> CommonSchema:
+        return CommonSchema(metadata=Metadata(name="cached_robot"))
+
+
+class TestParseCache:
+    """Tests for the BaseParser document cache."""
+    
+    def test_cache_without_base_init(self, tmp_path: Path):
+        """Test the cache works when a subclass skips super().__init__()."""
+        parser = CachingParser()
+        robot_file = tmp_path / "robot.txt"
+        robot_file.write_text("robot")
+        
+        assert parser._take_cached_document(robot_file) is None
+        parser._cache_document(robot_file, "document")
+        assert parser._take_cached_document(robot_file) == "document"
+        
+        # Documents are handed out once
+        assert parser._take_cached_document(robot_file) is None
+    
+    def test_cache_invalidated_by_file_change(self, tmp_path: Path):
+        """Test a cached document is dropped once its file is rewritten."""
+        parser = CachingParser()
+        robot_file = tmp_path / "robot.txt"
+        robot_file.write_text("robot")
+        parser._cache_document(robot_file, "document")
+        
+        # Same timestamp but different size, then a different timestamp
+        mtime_ns = robot_file.stat().st_mtime_ns
+        robot_file.write_text("modified robot")
+        os.utime(robot_file, ns=(mtime_ns, mtime_ns))
+        assert parser._take_cached_document(robot_file) is None
+        
+        parser._cache_document(robot_file, "document")
+        os.utime(robot_file, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+        assert parser._take_cached_document(robot_file) is None
+
+
 class TestBaseExporter:
     """Tests for BaseExporter class."""
     
@@ -140,7 +188,7 @@ class TestConversionEngine:
         format_name = engine.detect_format('test.unknown')
         assert format_name is None
     
-    def test_convert_success(self, temp_dir: Path):
+    def test_convert_success(self, tmp_path: Path):
         """Test successful conversion."""
         engine = ConversionEngine()
         parser = MockParser()
@@ -148,8 +196,8 @@ class TestConversionEngine:
         engine.register_parser('mock', parser)
         engine.register_exporter('mock', exporter)
         
-        input_file = temp_dir / "input.mock"
-        output_file = temp_dir / "output.txt"
+        input_file = tmp_path / "input.mock"
+        output_file = tmp_path / "output.txt"
         input_file.write_text("mock content")
         
         schema = engine.convert(str(input_file), str(output_file), 'mock', 'mock')
@@ -158,25 +206,25 @@ class TestConversionEngine:
         assert output_file.exists()
         assert "Mock export of mock_robot" in output_file.read_text()
     
-    def test_convert_no_parser(self, temp_dir: Path):
+    def test_convert_no_parser(self, tmp_path: Path):
         """Test conversion failure when no parser available."""
         engine = ConversionEngine()
         
-        input_file = temp_dir / "input.unknown"
-        output_file = temp_dir / "output.txt"
+        input_file = tmp_path / "input.unknown"
+        output_file = tmp_path / "output.txt"
         input_file.write_text("content")
         
         with pytest.raises(ValueError, match="No parser found"):
             engine.convert(str(input_file), str(output_file), 'unknown', 'mock')
     
-    def test_convert_no_exporter(self, temp_dir: Path):
+    def test_convert_no_exporter(self, tmp_path: Path):
         """Test conversion failure when no exporter available."""
         engine = ConversionEngine()
         parser = MockParser()
         engine.register_parser('mock', parser)
         
-        input_file = temp_dir / "input.mock"
-        output_file = temp_dir / "output.txt"
+        input_file = tmp_path / "input.mock"
+        output_file = tmp_path / "output.txt"
         input_file.write_text("content")
         
         with pytest.raises(ValueError, match="No exporter found"):
@@ -186,24 +234,30 @@ class TestConversionEngine:
 class TestFormatConverter:
     """Tests for FormatConverter class."""
     
-    def test_converter_initialization(self):
-        """Test converter initializes with engine."""
+    @pytest.fixture(scope="class")
+    def converter(self):
+        """Converter with mock formats registered, shared by the class."""
         converter = FormatConverter()
+        converter.engine.register_parser('mock', MockParser())
+        converter.engine.register_exporter('mock', MockExporter())
+        converter.engine.register_exporter('target', MockExporter())
+        return converter
+    
+    @pytest.fixture
+    def fresh_converter(self):
+        """Unshared converter for tests that need a clean engine."""
+        return FormatConverter()
+    
+    def test_converter_initialization(self, fresh_converter):
+        """Test converter initializes with engine."""
+        converter = fresh_converter
         assert converter.engine is not None
         assert isinstance(converter.engine, ConversionEngine)
     
-    def test_convert_method(self, temp_dir: Path):
+    def test_convert_method(self, converter, tmp_path: Path):
         """Test convert method delegates to engine."""
-        converter = FormatConverter()
-        
-        # Register mock parser and exporter
-        parser = MockParser()
-        exporter = MockExporter()
-        converter.engine.register_parser('mock', parser)
-        converter.engine.register_exporter('mock', exporter)
-        
-        input_file = temp_dir / "input.mock"
-        output_file = temp_dir / "output.txt"
+        input_file = tmp_path / "input.mock"
+        output_file = tmp_path / "output.txt"
         input_file.write_text("mock content")
         
         schema = converter.convert(
@@ -216,14 +270,10 @@ class TestFormatConverter:
         assert schema.metadata.name == "mock_robot"
         assert output_file.exists()
     
-    def test_to_schema_method(self, temp_dir: Path):
+    def test_to_schema_method(self, converter, tmp_path: Path):
         """Test to_schema method."""
-        converter = FormatConverter()
-        parser = MockParser()
-        converter.engine.register_parser('mock', parser)
-        
-        input_file = temp_dir / "input.mock"
-        output_file = temp_dir / "output.yaml"
+        input_file = tmp_path / "input.mock"
+        output_file = tmp_path / "output.yaml"
         input_file.write_text("mock content")
         
         schema = converter.to_schema(str(input_file), str(output_file))
@@ -231,14 +281,10 @@ class TestFormatConverter:
         assert schema.metadata.name == "mock_robot"
         assert output_file.exists()
     
-    def test_from_schema_method(self, temp_dir: Path):
+    def test_from_schema_method(self, converter, tmp_path: Path):
         """Test from_schema method."""
-        converter = FormatConverter()
-        exporter = MockExporter()
-        converter.engine.register_exporter('mock', exporter)
-        
         # Create a schema file
-        schema_file = temp_dir / "robot.yaml"
+        schema_file = tmp_path / "robot.yaml"
         schema_content = """
 metadata:
   name: "test_robot"
@@ -247,23 +293,15 @@ joints: []
 """
         schema_file.write_text(schema_content)
         
-        output_file = temp_dir / "output.txt"
+        output_file = tmp_path / "output.txt"
         
         converter.from_schema(str(schema_file), str(output_file), 'mock')
         
         assert output_file.exists()
         assert "Mock export of test_robot" in output_file.read_text()
     
-    def test_get_supported_formats(self):
+    def test_get_supported_formats(self, converter):
         """Test getting supported formats."""
-        converter = FormatConverter()
-        
-        # Register mock formats
-        parser = MockParser()
-        exporter = MockExporter()
-        converter.engine.register_parser('mock', parser)
-        converter.engine.register_exporter('mock', exporter)
-        
         formats = converter.engine.get_supported_formats()
         
         assert 'parsers' in formats
@@ -271,9 +309,9 @@ joints: []
         assert 'mock' in formats['parsers']
         assert 'mock' in formats['exporters']
     
-    def test_get_conversion_matrix(self):
+    def test_get_conversion_matrix(self, fresh_converter):
         """Test getting conversion matrix."""
-        converter = FormatConverter()
+        converter = fresh_converter
         
         # Register mock formats
         parser = MockParser()
@@ -290,25 +328,17 @@ joints: []
         assert 'mock2' in matrix['mock1']
         assert 'mock1' in matrix['mock2']
     
-    def test_batch_convert(self, temp_dir: Path):
+    def test_batch_convert(self, converter, tmp_path: Path):
         """Test batch conversion."""
-        converter = FormatConverter()
-        
-        # Register mock formats
-        parser = MockParser()
-        exporter = MockExporter()
-        converter.engine.register_parser('mock', parser)
-        converter.engine.register_exporter('target', exporter)
-        
         # Create input files
-        input_dir = temp_dir / "input"
+        input_dir = tmp_path / "input"
         input_dir.mkdir()
         
         (input_dir / "robot1.mock").write_text("robot1 content")
         (input_dir / "robot2.mock").write_text("robot2 content")
         (input_dir / "other.txt").write_text("other content")  # Should be ignored
         
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
         
         converted_files = converter.batch_convert(
             str(input_dir),
@@ -2,182 +2,153 @@
 Comprehensive tests for the robot format converter.
 """
 
+import json
+import sys
 import unittest
-import tempfile
 from pathlib import Path
 
-from robot_format_converter.parsers import URDFParser, MJCFParser
-from robot_format_converter.schema import JointType, ActuatorType, Inertia
+import numpy as np
+import pytest
 
+from robot_format_converter import parsers
+from robot_format_converter.parsers import (
+    URDFParser, MJCFParser, SchemaParser, ParseContext, _normalize_axes
+)
+from robot_format_converter.schema import (
+    JointType, ActuatorType, Inertia, Joint, Vector3, _UNIT_Z
+)
 
-class TestURDFParser(unittest.TestCase):
-    """Test cases for URDF parser."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.parser = URDFParser()
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_path = Path(self.temp_dir)
-    
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+
+# Canonical URDF samples, encoded once at import
+CAN_PARSE_URDF = b'''<?xml version="1.0"?>
+<robot name="test_robot">
+    <link name="base_link"/>
+</robot>'''
+
+INVALID_XML_URDF = b'''<?xml version="1.0"?>
+<robot name="test_robot">
+    <link name="base_link"
+</robot>'''
+
+NON_URDF = b'''<?xml version="1.0"?>
+<mujoco>
+    <worldbody/>
+</mujoco>'''
+
+WARNING_URDF = b'''<?xml version="1.0"?>
+<robot name="warning_robot">
+    <link name="base_link">
+        <inertial>
+            <mass value="-1.0"/>  <!-- Negative mass -->
+            <inertia ixx="-0.1" iyy="0.1" izz="0.1" ixy="0" ixz="0" iyz="0"/>
+        </inertial>
+    </link>
     
-    def create_temp_urdf(self, content: str) -> Path:
-        """Create a temporary URDF file with given content."""
-        urdf_file = self.temp_path / "test_robot.urdf"
-        with open(urdf_file, 'w') as f:
-            f.write(content)
-        return urdf_file
+    <joint name="joint1" type="revolute">
+        <parent link="base_link"/>
+        <child link="nonexistent_link"/>  <!-- Missing link -->
+        <limit lower="1.57" upper="-1.57"/>  <!-- Invalid limits -->
+    </joint>
+</robot>'''
+
+
+class TestURDFParser:
+    """Test cases for URDF parser."""
     
-    def test_can_parse_valid_urdf(self):
-        """Test parsing detection for valid URDF."""
-        urdf_content = '''<?xml version="1.0"?>
-        <robot name="test_robot">
-            <link name="base_link"/>
-        </robot>'''
-        
-        urdf_file = self.create_temp_urdf(urdf_content)
-        self.assertTrue(self.parser.can_parse(urdf_file))
+    @pytest.fixture
+    def parser(self):
+        """Fresh parser per test, so cached documents never leak between tests."""
+        return URDFParser()
     
-    def test_can_parse_invalid_xml(self):
-        """Test parsing detection for invalid XML."""
-        invalid_content = '''<?xml version="1.0"?>
-        <robot name="test_robot">
-            <link name="base_link"
-        </robot>'''
-        
-        urdf_file = self.create_temp_urdf(invalid_content)
-        self.assertFalse(self.parser.can_parse(urdf_file))
+    @pytest.mark.parametrize("content,expected", [
+        (CAN_PARSE_URDF, True),
+        (INVALID_XML_URDF, False),
+        (NON_URDF, False),
+    ], ids=["valid", "invalid_xml", "non_urdf"])
+    def test_can_parse(self, parser, tmp_path, content, expected):
+        """Test parsing detection for valid URDF, invalid XML and non-URDF XML."""
+        urdf_file = tmp_path / "test_robot.urdf"
+        urdf_file.write_bytes(content)
+        assert parser.can_parse(urdf_file) is expected
     
-    def test_can_parse_non_urdf(self):
-        """Test parsing detection for non-URDF XML."""
-        non_urdf_content = '''<?xml version="1.0"?>
-        <mujoco>
-            <worldbody/>
-        </mujoco>'''
-        
-        urdf_file = self.create_temp_urdf(non_urdf_content)
-        self.assertFalse(self.parser.can_parse(urdf_file))
+    def test_parse_missing_file(self, parser, tmp_path):
+        """Test a missing file raises FileNotFoundError with either XML backend."""
+        with pytest.raises(FileNotFoundError):
+            parser.parse(tmp_path / "missing.urdf")
     
-    def test_parse_basic_robot(self):
+    def test_parse_basic_robot(self, parsed_simple_urdf):
         """Test parsing a basic robot with link and joint."""
-        urdf_content = '''<?xml version="1.0"?>
-        <robot name="simple_robot">
-            <link name="base_link">
-                <inertial>
-                    <mass value="1.0"/>
-                    <origin xyz="0 0 0"/>
-                    <inertia ixx="0.1" iyy="0.1" izz="0.1" ixy="0" ixz="0" iyz="0"/>
-                </inertial>
-            </link>
-            
-            <link name="child_link">
-                <inertial>
-                    <mass value="0.5"/>
-                    <inertia ixx="0.05" iyy="0.05" izz="0.05" ixy="0" ixz="0" iyz="0"/>
-                </inertial>
-            </link>
-            
-            <joint name="joint1" type="revolute">
-                <parent link="base_link"/>
-                <child link="child_link"/>
-                <origin xyz="0 0 0.1" rpy="0 0 0"/>
-                <axis xyz="0 0 1"/>
-                <limit lower="-1.57" upper="1.57" effort="10" velocity="1"/>
-            </joint>
-        </robot>'''
-        
-        urdf_file = self.create_temp_urdf(urdf_content)
-        schema = self.parser.parse(urdf_file)
+        schema = parsed_simple_urdf
         
         # Verify basic structure
-        self.assertEqual(schema.metadata.name, "simple_robot")
-        self.assertEqual(len(schema.links), 2)
-        self.assertEqual(len(schema.joints), 1)
+        assert schema.metadata.name == "test_robot"
+        assert len(schema.links) == 2
+        assert len(schema.joints) == 1
         
         # Verify link properties
         base_link = schema.get_link("base_link")
-        self.assertIsNotNone(base_link)
-        self.assertEqual(base_link.mass, 1.0)
-        self.assertEqual(base_link.inertia.ixx, 0.1)
+        assert base_link is not None
+        assert base_link.mass == 1.0
+        assert base_link.inertia.ixx == 0.1
         
         # Verify joint properties
         joint = schema.get_joint("joint1")
-        self.assertIsNotNone(joint)
-        self.assertEqual(joint.type, JointType.REVOLUTE)
-        self.assertEqual(joint.parent_link, "base_link")
-        self.assertEqual(joint.child_link, "child_link")
-        self.assertIsNotNone(joint.limits)
-        self.assertEqual(joint.limits.lower, -1.57)
-        self.assertEqual(joint.limits.upper, 1.57)
+        assert joint is not None
+        assert joint.type == JointType.REVOLUTE
+        assert joint.parent_link == "base_link"
+        assert joint.child_link == "link1"
+        assert joint.limits is not None
+        assert joint.limits.lower == -3.14
+        assert joint.limits.upper == 3.14
     
-    def test_parse_with_warnings(self):
+    def test_parse_with_warnings(self, parser):
         """Test parsing with validation warnings."""
-        urdf_content = '''<?xml version="1.0"?>
-        <robot name="warning_robot">
-            <link name="base_link">
-                <inertial>
-                    <mass value="-1.0"/>  <!-- Negative mass -->
-                    <inertia ixx="-0.1" iyy="0.1" izz="0.1" ixy="0" ixz="0" iyz="0"/>
-                </inertial>
-            </link>
-            
-            <joint name="joint1" type="revolute">
-                <parent link="base_link"/>
-                <child link="nonexistent_link"/>  <!-- Missing link -->
-                <limit lower="1.57" upper="-1.57"/>  <!-- Invalid limits -->
-            </joint>
-        </robot>'''
-        
-        urdf_file = self.create_temp_urdf(urdf_content)
-        schema = self.parser.parse(urdf_file)
+        schema = parser.parse_bytes(WARNING_URDF)
         
         # Check that warnings were generated
         context = schema.extensions.get('parse_context', {})
         warnings = context.get('warnings', [])
         errors = context.get('errors', [])
         
-        self.assertTrue(len(warnings) > 0 or len(errors) > 0)
+        assert len(warnings) > 0 or len(errors) > 0
     
-    def test_inertia_validation(self):
+    def test_inertia_validation(self, parser):
         """Test inertia tensor validation."""
         # Valid inertia
         valid_inertia = Inertia(ixx=1.0, iyy=1.0, izz=1.0)
-        self.assertTrue(self.parser._validate_inertia(valid_inertia))
+        assert parser._validate_inertia(valid_inertia)
         
         # Invalid inertia (negative diagonal element)
         invalid_inertia = Inertia(ixx=-1.0, iyy=1.0, izz=1.0)
-        self.assertFalse(self.parser._validate_inertia(invalid_inertia))
+        assert not parser._validate_inertia(invalid_inertia)
         
         # Invalid inertia (triangle inequality violation)
         invalid_inertia2 = Inertia(ixx=1.0, iyy=1.0, izz=3.0)
-        self.assertFalse(self.parser._validate_inertia(invalid_inertia2))
+        assert not parser._validate_inertia(invalid_inertia2)
+        
+        # Thin plate sits exactly on the triangle inequality bound
+        plate_inertia = Inertia(ixx=1.0, iyy=1.0, izz=2.0)
+        assert parser._validate_inertia(plate_inertia)
 
 
-class TestMJCFParser(unittest.TestCase):
+class TestMJCFParser:
     """Test cases for MJCF parser."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.parser = MJCFParser()
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_path = Path(self.temp_dir)
-    
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture
+    def parser(self):
+        """Fresh parser per test, so cached documents never leak between tests."""
+        return MJCFParser()
     
-    def create_temp_mjcf(self, content: str) -> Path:
-        """Create a temporary MJCF file with given content."""
-        mjcf_file = self.temp_path / "test_robot.xml"
-        with open(mjcf_file, 'w') as f:
-            f.write(content)
-        return mjcf_file
+    @pytest.fixture
+    def create_temp_mjcf(self, tmp_path):
+        """Return a helper that writes an MJCF file with given content."""
+        def create(content: str) -> Path:
+            mjcf_file = tmp_path / "test_robot.xml"
+            mjcf_file.write_bytes(content.encode("ascii"))
+            return mjcf_file
+        return create
     
-    def test_can_parse_valid_mjcf(self):
+    def test_can_parse_valid_mjcf(self, parser, create_temp_mjcf):
         """Test parsing detection for valid MJCF."""
         mjcf_content = '''<?xml version="1.0"?>
         <mujoco model="test_robot">
@@ -186,20 +157,20 @@ class TestMJCFParser(unittest.TestCase):
             </worldbody>
         </mujoco>'''
         
-        mjcf_file = self.create_temp_mjcf(mjcf_content)
-        self.assertTrue(self.parser.can_parse(mjcf_file))
+        mjcf_file = create_temp_mjcf(mjcf_content)
+        assert parser.can_parse(mjcf_file)
     
-    def test_can_parse_non_mjcf(self):
+    def test_can_parse_non_mjcf(self, parser, create_temp_mjcf):
         """Test parsing detection for non-MJCF XML."""
         non_mjcf_content = '''<?xml version="1.0"?>
         <robot name="test_robot">
             <link name="base"/>
         </robot>'''
         
-        mjcf_file = self.create_temp_mjcf(non_mjcf_content)
-        self.assertFalse(self.parser.can_parse(mjcf_file))
+        mjcf_file = create_temp_mjcf(non_mjcf_content)
+        assert not parser.can_parse(mjcf_file)
     
-    def test_parse_basic_mjcf(self):
+    def test_parse_basic_mjcf(self, parser):
         """Test parsing a basic MJCF model."""
         mjcf_content = '''<?xml version="1.0"?>
         <mujoco model="simple_robot">
@@ -225,25 +196,125 @@ class TestMJCFParser(unittest.TestCase):
             </actuator>
         </mujoco>'''
         
-        mjcf_file = self.create_temp_mjcf(mjcf_content)
-        schema = self.parser.parse(mjcf_file)
+        schema = parser.parse_bytes(mjcf_content.encode())
         
         # Verify basic structure
-        self.assertEqual(schema.metadata.name, "simple_robot")
-        self.assertEqual(len(schema.links), 2)
-        self.assertEqual(len(schema.joints), 1)
-        self.assertEqual(len(schema.actuators), 1)
+        assert schema.metadata.name == "simple_robot"
+        assert len(schema.links) == 2
+        assert len(schema.joints) == 1
+        assert len(schema.actuators) == 1
         
         # Verify materials were parsed
         context = schema.extensions.get('parse_context', {})
         materials = context.get('materials', {})
-        self.assertIn('red', materials)
+        assert 'red' in materials
         
         # Verify actuator
         actuator = schema.actuators[0]
-        self.assertEqual(actuator.name, "motor1")
-        self.assertEqual(actuator.joint, "joint1")
-        self.assertEqual(actuator.type, ActuatorType.DC_MOTOR)
+        assert actuator.name == "motor1"
+        assert actuator.joint == "joint1"
+        assert actuator.type == ActuatorType.DC_MOTOR
+    
+    def test_parse_geom_groups(self, parser):
+        """Test geom group selects visual and/or collision representation."""
+        mjcf_content = '''<?xml version="1.0"?>
+        <mujoco model="grouped_robot">
+            <worldbody>
+                <body name="base_link">
+                    <geom type="sphere" size="0.1"/>
+                    <geom type="sphere" size="0.1" group="2"/>
+                    <geom type="sphere" size="0.1" group="3"/>
+                </body>
+            </worldbody>
+        </mujoco>'''
+        
+        schema = parser.parse_bytes(mjcf_content.encode())
+        
+        base_link = schema.get_link("base_link")
+        assert len(base_link.visuals) == 2
+        assert len(base_link.collisions) == 2
+
+
+class TestSchemaParser:
+    """Test cases for common schema JSON/YAML parser."""
+    
+    def test_null_mass_stays_none(self, tmp_path):
+        """Test an explicit null mass is kept as None rather than NaN."""
+        schema_file = tmp_path / "robot.json"
+        schema_file.write_text(json.dumps({
+            "metadata": {"name": "null_mass_robot"},
+            "links": [
+                {"name": "base_link", "mass": None},
+                {"name": "arm_link", "mass": 2, "center_of_mass": [0, 0, 0.5]},
+            ],
+        }))
+        
+        schema = SchemaParser().parse(schema_file)
+        
+        assert schema.get_link("base_link").mass is None
+        arm_link = schema.get_link("arm_link")
+        assert arm_link.mass == 2
+        assert arm_link.center_of_mass.z == 0.5
+
+
+class TestJointAxes:
+    """Test cases for batched joint axis normalization."""
+    
+    def test_normalize_small_batch(self):
+        """Test rows are scaled to unit length and their norms returned."""
+        axes = np.array([[0.0, 0.0, 2.0], [3.0, 4.0, 0.0]])
+        
+        norms = _normalize_axes(axes)
+        
+        np.testing.assert_allclose(norms, [2.0, 5.0])
+        np.testing.assert_allclose(axes, [[0.0, 0.0, 1.0], [0.6, 0.8, 0.0]])
+    
+    def test_normalize_leaves_zero_rows(self):
+        """Test rows at or below the tolerance are left untouched."""
+        axes = np.array([[0.0, 0.0, 0.0], [1e-8, 0.0, 0.0]])
+        
+        norms = _normalize_axes(axes)
+        
+        np.testing.assert_allclose(norms, [0.0, 1e-8])
+        np.testing.assert_array_equal(axes, [[0.0, 0.0, 0.0], [1e-8, 0.0, 0.0]])
+    
+    def test_apply_joint_axes(self, tmp_path):
+        """Test pending axes are assigned, with a warning for zero axes."""
+        context = ParseContext(
+            file_path=tmp_path / "robot.xml", base_dir=tmp_path,
+            materials={}, meshes={}, warnings=[], errors=[]
+        )
+        tilted = Joint(name="tilted", type=JointType.REVOLUTE,
+                       parent_link="base", child_link="arm")
+        degenerate = Joint(name="degenerate", type=JointType.REVOLUTE,
+                           parent_link="arm", child_link="hand")
+        context.pending_axes.append((tilted, [0.0, 2.0, 0.0]))
+        context.pending_axes.append((degenerate, [0.0, 0.0, 0.0]))
+        
+        MJCFParser()._apply_joint_axes(context)
+        
+        assert tilted.axis == Vector3(0.0, 1.0, 0.0)
+        assert degenerate.axis == _UNIT_Z
+        assert context.warnings == ["Zero-magnitude joint axis for degenerate"]
+        assert context.pending_axes == []
+    
+    def test_numba_matches_numpy(self, monkeypatch):
+        """Test the numba kernel agrees with the NumPy path on a large batch."""
+        pytest.importorskip("numba")
+        rng = np.random.default_rng(0)
+        axes = rng.normal(size=(parsers._NUMBA_MIN_AXES, 3))
+        axes[::97] = 0.0
+        
+        numba_axes = axes.copy()
+        numba_norms = _normalize_axes(numba_axes)
+        assert parsers._normalize_axes_nb
+        
+        monkeypatch.setattr(parsers, "_NUMBA_MIN_AXES", len(axes) + 1)
+        numpy_axes = axes.copy()
+        numpy_norms = _normalize_axes(numpy_axes)
+        
+        np.testing.assert_allclose(numba_norms, numpy_norms, rtol=1e-12)
+        np.testing.assert_allclose(numba_axes, numpy_axes, rtol=1e-12, atol=1e-15)
 
 
 class TestIntegrationScenarios(unittest.TestCase):
@@ -274,8 +345,8 @@ class TestValidationHelpers(unittest.TestCase):
         parser = URDFParser()
         
         # Valid cases
-        self.assertEqual(parser._parse_xyz("1 2 3"), [1.0, 2.0, 3.0])
-        self.assertEqual(parser._parse_xyz("0.1 -0.2 0.3"), [0.1, -0.2, 0.3])
+        self.assertEqual(parser._parse_xyz("1 2 3"), (1.0, 2.0, 3.0))
+        self.assertEqual(parser._parse_xyz("0.1 -0.2 0.3"), (0.1, -0.2, 0.3))
         
         # Invalid cases
         self.assertIsNone(parser._parse_xyz("1 2"))  # Too few values
@@ -288,8 +359,8 @@ class TestValidationHelpers(unittest.TestCase):
         parser = URDFParser()
         
         # Valid cases
-        self.assertEqual(parser._parse_rpy("0 0 0"), [0.0, 0.0, 0.0])
-        self.assertEqual(parser._parse_rpy("1.57 0 -1.57"), [1.57, 0.0, -1.57])
+        self.assertEqual(parser._parse_rpy("0 0 0"), (0.0, 0.0, 0.0))
+        self.assertEqual(parser._parse_rpy("1.57 0 -1.57"), (1.57, 0.0, -1.57))
         
         # Invalid cases
         self.assertIsNone(parser._parse_rpy("1 2"))  # Too few values
@@ -311,5 +382,6 @@ class TestValidationHelpers(unittest.TestCase):
 
 
 if __name__ == '__main__':
-    # Run all tests
-    unittest.main(verbosity=2)
+    # Run all tests; the parser classes use pytest fixtures, which
+    # unittest.main cannot collect
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,227 @@
+# Copyright [2021-2025] Thanh Nguyen
+# Copyright [2022-2023] [CNRS, Toward SAS]
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the unified robot schema."""
+
+from dataclasses import asdict
+
+import numpy as np
+
+from robot_format_converter.schema import (
+    CommonSchema, Metadata, Link, Joint, JointType, Inertia, Quaternion
+)
+
+
+def make_schema(link_names, joint_pairs) -> CommonSchema:
+    """Build a schema from link names and (parent, child) joint pairs."""
+    return CommonSchema(
+        metadata=Metadata(name="test_robot"),
+        links=[Link(name=name) for name in link_names],
+        joints=[
+            Joint(name=f"joint{i}", type=JointType.REVOLUTE,
+                  parent_link=parent, child_link=child)
+            for i, (parent, child) in enumerate(joint_pairs)
+        ]
+    )
+
+
+class TestSchemaValidation:
+    """Tests for CommonSchema.validate."""
+    
+    def test_valid_chain(self):
+        """Test a simple chain validates cleanly."""
+        schema = make_schema(["base", "arm", "hand"],
+                             [("base", "arm"), ("arm", "hand")])
+        assert schema.validate() == []
+    
+    def test_kinematic_loop(self):
+        """Test a link reached through two joints is reported once."""
+        schema = make_schema(["base", "arm", "hand"],
+                             [("base", "arm"), ("arm", "hand"), ("hand", "arm")])
+        issues = schema.validate()
+        
+        loop_issues = [issue for issue in issues if "reached more than once" in issue]
+        assert loop_issues == [
+            "Link 'arm' is reached more than once - kinematic loop or multiple parents"
+        ]
+    
+    def test_duplicate_link_name_is_not_a_loop(self):
+        """Test duplicate root links report only the duplicate name."""
+        schema = make_schema(["base", "base", "arm"], [("base", "arm")])
+        assert schema.validate() == ["Duplicate link name: base"]
+    
+    def test_non_string_names(self):
+        """Test names of mixed types are checked without sorting them."""
+        schema = make_schema(["base", 1], [("base", 1)])
+        assert schema.validate() == []
+        
+        schema.links.append(Link(name=1))
+        assert schema.validate() == ["Duplicate link name: 1"]
+    
+    def test_validate_sees_later_edits(self):
+        """Test validate reflects links/joints edited after an earlier call."""
+        schema = make_schema(["base", "arm"], [("base", "arm")])
+        assert schema.validate() == []
+        
+        schema.joints.append(Joint(name="extra", type=JointType.FIXED,
+                                   parent_link="arm", child_link="tool"))
+        assert schema.validate() == [
+            "Joint 'extra' references unknown child link: tool"
+        ]
+        
+        schema.links.append(Link(name="tool"))
+        assert schema.validate() == []
+    
+    def test_validate_leaves_no_state(self):
+        """Test validate does not add fields to asdict/repr output."""
+        schema = make_schema(["base"], [])
+        before = asdict(schema)
+        schema.validate()
+        assert asdict(schema) == before
+        assert "table" not in repr(schema)
+
+
+class TestNameLookup:
+    """Tests for CommonSchema.get_link/get_joint name indices."""
+    
+    def test_miss_does_not_rebuild_index(self):
+        """Test repeated misses reuse the existing index."""
+        schema = make_schema(["base", "arm"], [("base", "arm")])
+        assert schema.get_link("base") is schema.links[0]
+        index = schema._link_index
+        
+        for _ in range(3):
+            assert schema.get_link("missing") is None
+        assert schema._link_index is index
+    
+    def test_miss_then_rename(self):
+        """Test a rename is found once the indices are invalidated."""
+        schema = make_schema(["base", "arm"], [("base", "arm")])
+        arm = schema.links[1]
+        assert schema.get_link("tool") is None
+        
+        arm.name = "tool"
+        schema.invalidate_indices()
+        
+        assert schema.get_link("tool") is arm
+        assert schema.get_link("arm") is None
+    
+    def test_duplicate_resolves_to_first_occurrence(self):
+        """Test an in-place replacement creating a duplicate keeps first-match order."""
+        schema = make_schema(["base", "arm"], [("base", "arm")])
+        assert schema.get_link("arm") is schema.links[1]
+        
+        schema.links[0] = Link(name="arm")
+        schema.invalidate_indices()
+        
+        assert schema.get_link("arm") is schema.links[0]
+        assert schema.get_link("base") is None
+
+
+class TestInertia:
+    """Tests for Inertia."""
+    
+    def test_to_matrix_returns_writable_copy(self):
+        """Test modifying a returned matrix does not affect later calls."""
+        inertia = Inertia(ixx=1.0, iyy=2.0, izz=3.0, ixy=0.1)
+        
+        matrix = inertia.to_matrix()
+        matrix[0, 0] = 99.0
+        
+        np.testing.assert_array_equal(
+            inertia.to_matrix(),
+            [[1.0, 0.1, 0.0], [0.1, 2.0, 0.0], [0.0, 0.0, 3.0]]
+        )
+    
+    def test_to_matrix_tracks_component_changes(self):
+        """Test the cached matrix is rebuilt after a component changes."""
+        inertia = Inertia(ixx=1.0, iyy=1.0, izz=1.0)
+        inertia.to_matrix()
+        inertia.izz = 5.0
+        assert inertia.to_matrix()[2, 2] == 5.0
+
+
+def rpy_matrix(roll, pitch, yaw) -> np.ndarray:
+    """Reference rotation R = Rz(yaw) Ry(pitch) Rx(roll)."""
+    cr, sr = np.cos(roll), np.sin(roll)
+    cp, sp = np.cos(pitch), np.sin(pitch)
+    cy, sy = np.cos(yaw), np.sin(yaw)
+    rx = np.array([[1, 0, 0], [0, cr, -sr], [0, sr, cr]])
+    ry = np.array([[cp, 0, sp], [0, 1, 0], [-sp, 0, cp]])
+    rz = np.array([[cy, -sy, 0], [sy, cy, 0], [0, 0, 1]])
+    return rz @ ry @ rx
+
+
+def quaternion_matrix(x, y, z, w) -> np.ndarray:
+    """Rotation matrix of a unit quaternion."""
+    return np.array([
+        [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+        [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+        [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+    ])
+
+
+class TestQuaternion:
+    """Tests for Quaternion roll-pitch-yaw conversions."""
+    
+    def test_from_rpy_known_values(self):
+        """Test single-axis rotations against their known quaternions."""
+        half = np.sqrt(0.5)
+        cases = [
+            ((0.0, 0.0, 0.0), [0.0, 0.0, 0.0, 1.0]),
+            ((0.0, 0.0, np.pi / 2), [0.0, 0.0, half, half]),
+            ((0.0, np.pi / 2, 0.0), [0.0, half, 0.0, half]),
+            ((np.pi, 0.0, 0.0), [1.0, 0.0, 0.0, 0.0]),
+        ]
+        for rpy, expected in cases:
+            np.testing.assert_allclose(Quaternion.from_rpy(*rpy).to_list(),
+                                       expected, rtol=0, atol=1e-12)
+            np.testing.assert_allclose(Quaternion.from_rpy_batch([rpy])[0],
+                                       expected, rtol=0, atol=1e-12)
+    
+    def test_from_rpy_matches_rotation_matrix(self):
+        """Test a combined roll/pitch/yaw against a reference rotation matrix."""
+        rpy = (0.3, -0.7, 1.2)
+        expected = rpy_matrix(*rpy)
+        
+        q = Quaternion.from_rpy(*rpy)
+        np.testing.assert_allclose(quaternion_matrix(q.x, q.y, q.z, q.w),
+                                   expected, rtol=0, atol=1e-12)
+        
+        row = Quaternion.from_rpy_batch([rpy])[0]
+        np.testing.assert_allclose(quaternion_matrix(*row),
+                                   expected, rtol=0, atol=1e-12)
+    
+    def test_from_rpy_batch_matches_scalar(self):
+        """Test batch conversion agrees with from_rpy, including gimbal lock."""
+        half_pi = np.pi / 2
+        rpy = np.array([
+            [0.0, 0.0, 0.0],
+            [0.3, -0.7, 1.2],
+            [np.pi, 0.0, -np.pi],
+            [0.4, half_pi, -0.9],   # gimbal lock, pitch = +90 deg
+            [-1.1, -half_pi, 0.6],  # gimbal lock, pitch = -90 deg
+        ])
+        
+        batch = Quaternion.from_rpy_batch(rpy)
+        
+        assert batch.shape == (len(rpy), 4)
+        expected = [Quaternion.from_rpy(*angles).to_list() for angles in rpy]
+        np.testing.assert_allclose(batch, expected, rtol=0, atol=1e-12)
+    
+    def test_from_rpy_unit_norm(self):
+        """Test from_rpy produces a unit quaternion."""
+        q = Quaternion.from_rpy(0.5, np.pi / 2, -2.0)
+        assert np.isclose(np.linalg.norm(q.to_list()), 1.0)
@@ -0,0 +1,112 @@
+# Copyright [2021-2025] Thanh Nguyen
+# Copyright [2022-2023] [CNRS, Toward SAS]
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the unified robot schema."""
+"""Tests for the conversion utilities."""
+
+import copy
+import json
+
+from robot_format_converter.utils import (
+    conversion_matrix, get_format_info, merge_extensions
+)
+
+
+class TestFormatTables:
+    """Tests for get_format_info and conversion_matrix."""
+    
+    def test_format_info_is_fresh_copy(self):
+        """Test a returned format info can be modified and serialized."""
+        info = get_format_info("URDF")
+        assert info["extensions"] == [".urdf"]
+        
+        info["extensions"].append(".xacro")
+        info["name"] = "changed"
+        json.dumps(info)
+        
+        assert get_format_info("urdf")["extensions"] == [".urdf"]
+        assert get_format_info("urdf")["name"] == "Unified Robot Description Format"
+    
+    def test_unknown_format_info(self):
+        """Test an unknown format gives an empty dict."""
+        assert get_format_info("unknown") == {}
+    
+    def test_conversion_matrix_is_fresh_copy(self):
+        """Test a returned matrix can be modified and serialized."""
+        matrix = conversion_matrix()
+        assert matrix["urdf"]["sdf"] is True
+        
+        matrix["urdf"]["sdf"] = False
+        del matrix["sdf"]
+        json.dumps(matrix)
+        
+        assert conversion_matrix()["urdf"]["sdf"] is True
+        assert "sdf" in conversion_matrix()
+
+
+class TestMergeExtensions:
+    """Tests for merge_extensions."""
+    
+    BASE = {"urdf": {"material": {"color": "red", "shine": 1}}, "keep": 1}
+    NEW = {"urdf": {"material": {"color": "blue"}, "gazebo": {"mu": 0.5}}, "extra": 2}
+    MERGED = {
+        "urdf": {"material": {"color": "blue", "shine": 1}, "gazebo": {"mu": 0.5}},
+        "keep": 1,
+        "extra": 2,
+    }
+    
+    def test_copy_leaves_inputs_unchanged(self):
+        """Test a copying merge combines nested dicts without touching its inputs."""
+        base = copy.deepcopy(self.BASE)
+        new = copy.deepcopy(self.NEW)
+        
+        merged = merge_extensions(base, new)
+        
+        assert merged == self.MERGED
+        assert base == self.BASE
+        assert new == self.NEW
+        assert merged is not base
+        assert merged["urdf"] is not base["urdf"]
+        assert merged["urdf"]["material"] is not base["urdf"]["material"]
+    
+    def test_copy_with_empty_side(self):
+        """Test a copying merge returns a copy when either side is empty."""
+        base = {"a": 1}
+        assert merge_extensions(base, {}) == base
+        assert merge_extensions(base, {}) is not base
+        assert merge_extensions({}, base) is not base
+    
+    def test_no_copy_updates_base_in_place(self):
+        """Test copy=False merges into base_ext and its nested dicts."""
+        base = copy.deepcopy(self.BASE)
+        new = copy.deepcopy(self.NEW)
+        urdf = base["urdf"]
+        material = urdf["material"]
+        
+        merged = merge_extensions(base, new, copy=False)
+        
+        assert merged is base
+        assert merged == self.MERGED
+        assert merged["urdf"] is urdf
+        assert merged["urdf"]["material"] is material
+        # Values only present in new_ext are shared, not copied
+        assert merged["urdf"]["gazebo"] is new["urdf"]["gazebo"]
+        assert new == self.NEW
+    
+    def test_no_copy_with_empty_side(self):
+        """Test copy=False returns the non-empty input itself."""
+        base = {"a": 1}
+        assert merge_extensions(base, {}, copy=False) is base
+        assert merge_extensions({}, base, copy=False) is base